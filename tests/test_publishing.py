@@ -1,5 +1,6 @@
 """Test suite for publishing and export functionality."""
 import pytest
+import csv
 import json
 import tempfile
 from pathlib import Path
@@ -19,7 +20,7 @@ from youtube_to_article.models.schemas import (
 )
 from youtube_to_article.publishing.manager import PublishingManager
 from youtube_to_article.publishers.base import PublishConfig, PublishingPlatform
-from youtube_to_article.exporters import MarkdownExporter, JSONExporter, HTMLExporter, CSVExporter
+from youtube_to_article.exporters import BaseExporter, MarkdownExporter, JSONExporter, HTMLExporter, CSVExporter, export_all
 
 
 @pytest.fixture
@@ -180,6 +181,19 @@ class TestExporters:
             assert path.exists()
 
 
+class BrokenExporter(BaseExporter):
+    """Exporter that always fails, for error handling tests."""
+
+    @property
+    def file_extension(self) -> str:
+        """Return file extension."""
+        return "txt"
+
+    def export(self, final_output, filename=None):
+        """Fail instead of exporting."""
+        raise RuntimeError("export failed")
+
+
 class TestPublishingManager:
     """Test publishing manager functionality."""
 
@@ -213,6 +227,27 @@ class TestPublishingManager:
         assert "html" in exports
         assert "csv" in exports
 
+    def test_concurrent_export_matches_sequential(self, sample_final_output, tmp_path):
+        """Test concurrent export writes the same files as exporting one format at a time."""
+        manager = PublishingManager(output_dir=tmp_path / "concurrent")
+        exports = manager.export(sample_final_output)
+        combined = export_all(sample_final_output, list(PublishingManager.AVAILABLE_EXPORTERS.values()), tmp_path / "combined")
+
+        for (fmt, exporter_class), combined_path in zip(PublishingManager.AVAILABLE_EXPORTERS.items(), combined):
+            sequential_path = exporter_class(tmp_path / "sequential").export(sample_final_output)
+            assert exports[fmt].read_bytes() == sequential_path.read_bytes()
+            assert combined_path.read_bytes() == sequential_path.read_bytes()
+
+    def test_failing_format_is_skipped(self, sample_final_output, tmp_path):
+        """Test one failing format does not lose the other exports."""
+        manager = PublishingManager(output_dir=tmp_path)
+        manager.AVAILABLE_EXPORTERS = {**PublishingManager.AVAILABLE_EXPORTERS, "broken": BrokenExporter}
+
+        exports = manager.export(sample_final_output, formats=["markdown", "broken", "csv"])
+
+        assert set(exports) == {"markdown", "csv"}
+        assert all(path.exists() for path in exports.values())
+
     def test_publishing_history_save(self, sample_final_output, tmp_path):
         """Test saving publishing history."""
         manager = PublishingManager(output_dir=tmp_path)
@@ -314,6 +349,50 @@ class TestExportFormats:
         assert "Type" in lines[0]
         assert "Content" in lines[0]
 
+    def test_csv_round_trip(self, sample_final_output, tmp_path):
+        """Test CSV rows read back to the article, metadata and SEO fields, quoting included."""
+        article = sample_final_output.article.model_copy(update={"sections": [
+            ArticleSection(heading='Commas, "quotes"', content="Line one,\nline two", word_count=4),
+        ]})
+        output = sample_final_output.model_copy(update={"article": article})
+
+        path = CSVExporter(output_dir=tmp_path).export(output)
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+
+        assert rows == [
+            ["Type", "Content", "Additional"],
+            ["Headline", "Test Article Title", ""],
+            ["Introduction", "This is a test article introduction.", ""],
+            ["Section Heading", 'Commas, "quotes"', "Word Count: 4"],
+            ["Section Content", "Line one,\nline two", ""],
+            ["Conclusion", "This is the test conclusion.", ""],
+            ["Metadata", "Source Video", "Test Video Title"],
+            ["Metadata", "Channel", "Test Channel"],
+            ["Metadata", "Video ID", "test123"],
+            ["Metadata", "Video Duration", "600 seconds"],
+            ["SEO", "Meta Title", "Test Article - Keywords"],
+            ["SEO", "Meta Description", "Short description of test article"],
+            ["SEO", "Slug", "test-article-title"],
+            ["SEO", "Primary Keyword", "test"],
+            ["SEO", "Secondary Keywords", "article, testing"],
+        ]
+
+    def test_csv_round_trip_without_seo(self, sample_final_output, tmp_path):
+        """Test CSV export without an SEO package has no SEO rows."""
+        output = sample_final_output.model_copy(update={"seo": None})
+
+        path = CSVExporter(output_dir=tmp_path).export(output)
+        with open(path, newline="", encoding="utf-8") as f:
+            rows = list(csv.DictReader(f))
+
+        assert path.stem == "test123"
+        assert [row["Type"] for row in rows] == [
+            "Headline", "Introduction", "Section Heading", "Section Content", "Conclusion",
+            "Metadata", "Metadata", "Metadata", "Metadata",
+        ]
+        assert rows[2] == {"Type": "Section Heading", "Content": "Test Section", "Additional": "Word Count: 50"}
+
 
 class TestErrorHandling:
     """Test error handling in exporters and publishers."""
@@ -3,7 +3,7 @@ import json
 import logging
 import re
 from typing import Optional
-from datetime import datetime
+from datetime import datetime, timezone
 from huggingface_hub import InferenceClient
 
 from models.schemas import (
@@ -62,7 +62,7 @@ ARTICLE CONTENT (first 500 chars):
 
 CONTENT ANALYSIS:
 - Main Topic: {analysis.main_topic}
-- Subtopics: {', '.join(analysis.subtopics)}
+- Subtopics: {analysis.rendered_subtopics}
 - Target Audience: {analysis.target_audience}
 
 SOURCE VIDEO:
@@ -111,23 +111,44 @@ Return ONLY valid JSON, no additional text."""
             logger.debug(f"Response was: {response[:500]}...")
             raise ValueError(f"LLM returned invalid JSON: {e}")
 
-    def _generate_schema_markup(
+    def _generate_structured(
         self,
         article: Article,
         video_meta: VideoMetadata,
-        seo_data: dict
-    ) -> dict:
-        """Generate Schema.org Article markup."""
-        return {
+        seo_data: dict,
+        now_iso: str
+    ) -> tuple[dict, dict, dict]:
+        """
+        Generate Schema.org markup, Open Graph tags and Twitter Card tags.
+
+        The three structured-data blocks share most of their values, so they
+        are built in a single pass from the same locals.
+
+        Args:
+            article: Generated article
+            video_meta: Source video metadata
+            seo_data: Parsed LLM SEO response
+            now_iso: Fallback publish timestamp when the video has no upload date
+
+        Returns:
+            Tuple of (schema_markup, open_graph, twitter_card)
+        """
+        meta_title = seo_data.get('meta_title', article.headline)
+        meta_desc = seo_data.get('meta_description', '')
+        thumb = video_meta.thumbnail_url or ""
+        slug = seo_data.get('slug', '')
+        pub = video_meta.upload_date or now_iso
+
+        schema_markup = {
             "@context": "https://schema.org",
             "@type": "Article",
             "headline": article.headline,
-            "description": seo_data.get('meta_description', ''),
+            "description": meta_desc,
             "author": {
                 "@type": "Person",
                 "name": video_meta.channel
             },
-            "datePublished": video_meta.upload_date or datetime.now().isoformat(),
+            "datePublished": pub,
             "articleBody": article.markdown,
             "wordCount": article.word_count,
             "keywords": [seo_data.get('primary_keyword', '')] + seo_data.get('secondary_keywords', []),
@@ -141,39 +162,27 @@ Return ONLY valid JSON, no additional text."""
             }
         }
 
-    def _generate_open_graph(
-        self,
-        article: Article,
-        video_meta: VideoMetadata,
-        seo_data: dict
-    ) -> dict:
-        """Generate Open Graph tags."""
-        return {
+        open_graph = {
             "og:type": "article",
-            "og:title": seo_data.get('meta_title', article.headline),
-            "og:description": seo_data.get('meta_description', ''),
-            "og:url": f"https://example.com/articles/{seo_data.get('slug', '')}",
-            "og:image": video_meta.thumbnail_url or "",
+            "og:title": meta_title,
+            "og:description": meta_desc,
+            "og:url": f"https://example.com/articles/{slug}",
+            "og:image": thumb,
             "og:site_name": "Your Site Name",
             "article:author": video_meta.channel,
-            "article:published_time": video_meta.upload_date or datetime.now().isoformat(),
+            "article:published_time": pub,
         }
 
-    def _generate_twitter_card(
-        self,
-        article: Article,
-        video_meta: VideoMetadata,
-        seo_data: dict
-    ) -> dict:
-        """Generate Twitter Card tags."""
-        return {
+        twitter_card = {
             "twitter:card": "summary_large_image",
-            "twitter:title": seo_data.get('meta_title', article.headline),
-            "twitter:description": seo_data.get('meta_description', ''),
-            "twitter:image": video_meta.thumbnail_url or "",
+            "twitter:title": meta_title,
+            "twitter:description": meta_desc,
+            "twitter:image": thumb,
             "twitter:creator": f"@{video_meta.channel}",
         }
 
+        return schema_markup, open_graph, twitter_card
+
     def run(
         self,
         article: Article,
@@ -231,10 +240,11 @@ Return ONLY valid JSON, no additional text."""
             meta_description = seo_data.get('meta_description', '')[:160]
             slug = re.sub(r'[^a-z0-9-]', '', seo_data.get('slug', '').lower().replace(' ', '-'))
 
-            # Generate structured data
-            schema_markup = self._generate_schema_markup(article, video_meta, seo_data)
-            open_graph = self._generate_open_graph(article, video_meta, seo_data)
-            twitter_card = self._generate_twitter_card(article, video_meta, seo_data)
+            # Generate structured data (one timestamp shared by all blocks)
+            now_iso = datetime.now(timezone.utc).isoformat()
+            schema_markup, open_graph, twitter_card = self._generate_structured(
+                article, video_meta, seo_data, now_iso=now_iso
+            )
 
             # Build social posts
             social_posts = SocialPosts(
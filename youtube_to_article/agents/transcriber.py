@@ -168,6 +168,8 @@ class TranscriberAgent:
         """
         Clear transcript cache.
 
+        Generated articles are cached separately; see WriterAgent.clear_cache().
+
         Args:
             video_id: Specific video ID to clear, or None to clear all
         """
@@ -1,7 +1,18 @@
 """Agent 3: Article Writer - Transforms transcript into polished article."""
+import asyncio
+import functools
+import hashlib
+import io
+import json
 import logging
-from typing import Optional
-from huggingface_hub import InferenceClient
+import re
+import shelve
+import threading
+import time
+from enum import IntEnum
+from pathlib import Path
+from typing import Generator, List, Optional, Tuple
+from huggingface_hub import AsyncInferenceClient, InferenceClient
 
 from models.schemas import (
     TranscriptResult,
@@ -14,6 +25,119 @@ from config.settings import PipelineConfig
 
 logger = logging.getLogger(__name__)
 
+# Matches "# Headline" and "## Section" lines in "\n"-terminated markdown;
+# group 2 is the header text without surrounding blanks
+_HEADER_RE = re.compile(r'^(#{1,2})[ \t]+(.+?)[ \t]*$', re.MULTILINE)
+
+# Opening or closing line of a fenced code block; "#" lines inside are code
+_FENCE_RE = re.compile(r'^[ \t]{0,3}(?:```|~~~)', re.MULTILINE)
+
+
+class _ParseState(IntEnum):
+    """Article parser states; also used to tag the kind of each parsed span."""
+    HEADLINE = 0
+    INTRO = 1
+    SECTION = 2
+    CONCLUSION = 3
+
+
+# Delimiter the model is asked to emit between articles in a batched response
+_BATCH_DELIM_RE = re.compile(r'^=== ARTICLE (\d+) ===[ \t]*$', re.MULTILINE)
+
+# Verbal fillers dropped from transcripts before prompting. Phrases that also
+# carry meaning ("you know", "like", ...) are only treated as filler when they
+# open a sentence and are followed by a comma. Expects whitespace collapsed.
+_FILLER_RE = re.compile(
+    r'\b(?:u+h+|u+m+|basically|literally)\b[\s,]*'
+    r'|(?:^|(?<=[.!?] ))(?:you know|i mean|like|so),\s*',
+    re.IGNORECASE
+)
+_WHITESPACE_RE = re.compile(r'\s+')
+
+# Sentence boundaries used when compacting long transcripts
+_SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_COMPACT_SEGMENTS = 6
+
+# (temperature, top_p) per theme style: near-greedy for factual styles,
+# more sampling for conversational and editorial ones
+_SAMPLING_BY_STYLE = {
+    "professional": (0.2, 0.9),
+    "news": (0.2, 0.9),
+    "casual": (0.5, 0.95),
+    "how-to": (0.5, 0.95),
+    "opinion": (0.8, 0.95),
+}
+_CREATIVE_SAMPLING = (0.8, 0.95)
+_DEFAULT_SAMPLING = (0.7, 1.0)
+
+# Requests at or below this temperature are near-deterministic and cached
+_CACHEABLE_TEMPERATURE = 0.3
+
+# Rough token estimate used for budgeting requests
+_TOKENS_PER_WORD = 1.3
+_MAX_OUTPUT_TOKENS = 4000
+
+# Serializes access to the on-disk response cache across sessions/threads
+_cache_lock = threading.Lock()
+
+
+def _code_fences(markdown: str) -> List[Tuple[int, int]]:
+    """(start, end) offsets of fenced code blocks; an unclosed fence runs to the end."""
+    marks = [match.start() for match in _FENCE_RE.finditer(markdown)]
+    if len(marks) % 2:
+        marks.append(len(markdown))
+    return list(zip(marks[::2], marks[1::2]))
+
+
+def _in_fence(fences: List[Tuple[int, int]], pos: int) -> bool:
+    """Whether offset pos falls inside one of fences."""
+    return any(start <= pos < end for start, end in fences)
+
+
+def _saved_at(entry) -> float:
+    """Timestamp of a (saved_at, markdown) cache entry; 0 for untimestamped legacy entries."""
+    return entry[0] if isinstance(entry, tuple) else 0.0
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(token: str) -> InferenceClient:
+    """Return a process-wide InferenceClient for token, reusing its HTTP connection pool."""
+    return InferenceClient(token=token)
+
+
+# Theme guidance text, keyed by the corresponding ArticleTheme field value
+_STYLE_GUIDANCE = {
+    "professional": "Write in a formal, authoritative tone. Use technical terminology appropriately. Focus on credibility and professionalism.",
+    "casual": "Write in a friendly, conversational tone. Use colloquial language where appropriate. Make the content relatable and engaging.",
+    "news": "Write as a journalist would. Focus on facts, objectivity, and newsworthiness. Use the inverted pyramid structure (most important info first).",
+    "how-to": "Write step-by-step instructions. Use imperative language ('Do this', 'Follow this'). Include clear action items and practical guidance.",
+    "opinion": "Include editorial perspective and analysis. Use stronger statements and interpretations. Include thoughtful commentary and expert perspective."
+}
+
+_LENGTH_GUIDANCE = {
+    "concise": "Keep the article brief and to the point. Aim for ~800-1000 words. Use bullet points and short paragraphs.",
+    "standard": "Write a standard-length article with good depth. Aim for ~1500-2000 words. Balance detail with readability.",
+    "comprehensive": "Create an in-depth, thorough article. Aim for ~2500-3500 words. Include detailed explanations and multiple examples."
+}
+
+_AUDIENCE_GUIDANCE = {
+    "expert": "Write for experts who have deep domain knowledge. Use technical jargon and advanced concepts. Skip basic explanations.",
+    "beginner": "Write for beginners with minimal background. Explain concepts clearly. Avoid jargon or define all terms used.",
+    "general": "Write for a general audience. Use accessible language. Include brief explanations of concepts that may be unfamiliar."
+}
+
+_TONE_GUIDANCE = {
+    "creative": "Use creative language, metaphors, and engaging examples. Prioritize engagement and entertainment value.",
+    "neutral": "Maintain a balanced, objective tone. Present information without excessive emotion or opinion.",
+    "formal": "Use formal, professional language throughout. Maintain a serious, authoritative tone."
+}
+
+_VISUAL_GUIDANCE = {
+    "code-heavy": "Include code examples, technical diagrams, and snippets throughout the article. Use code blocks liberally.",
+    "minimal": "Minimize code blocks and technical diagrams. Focus on prose. Use lists and bold text sparingly.",
+    "balanced": "Include a balanced mix of tables, lists, code blocks, and prose. Use visual elements where they enhance understanding."
+}
+
 
 class WriterAgent:
     """
@@ -27,6 +151,29 @@ class WriterAgent:
     - Converts spoken language to written prose
     """
 
+    # Static system prompt shared by every request. Everything per-video goes in
+    # the user message so providers with prefix caching can reuse this part.
+    _SYSTEM_PROMPT = (
+        "You are an expert content writer specializing in transforming video transcripts "
+        "into engaging, well-structured articles. Write in a clear, professional style.\n\n"
+        "Write a comprehensive, engaging article from the video transcript you are given, "
+        "following these requirements:\n\n"
+        "STRUCTURE:\n"
+        "1. Headline: Create an engaging, SEO-friendly headline (NOT just the video title)\n"
+        "2. Introduction: Write a hook paragraph that draws readers in (avoid \"In this article...\" openings)\n"
+        "3. Body Sections: Follow the sections listed under SUGGESTED STRUCTURE\n"
+        "4. Conclusion: Summarize key takeaways\n\n"
+        "STYLE REQUIREMENTS:\n"
+        "- Convert spoken language to polished written prose\n"
+        "- Remove verbal fillers (\"um\", \"you know\", \"like\", \"so\", etc.)\n"
+        "- Transform spoken references (\"as I showed you\") to written form (\"as demonstrated above\")\n"
+        "- Preserve important quotes with proper attribution\n"
+        "- Use markdown formatting (headers, bold, lists, etc.)\n"
+        "- Match the tone and reading time given in CONTENT ANALYSIS\n"
+        "- Follow any CUSTOM THEME PREFERENCES given at the end of the request\n\n"
+        "Return the article in proper markdown format with clear section headers (## for main sections)."
+    )
+
     def __init__(self, config: PipelineConfig):
         """
         Initialize the Writer agent.
@@ -35,68 +182,39 @@ class WriterAgent:
             config: Pipeline configuration with HF token and model selection
         """
         self.config = config
-        self.client = InferenceClient(token=config.hf_token)
+        self.client = _get_client(config.hf_token)
+        # Not shared: the async client binds its HTTP session to the first event loop it runs on
+        self.async_client = AsyncInferenceClient(token=config.hf_token)
         self.model = config.writer_model
 
-        logger.info(f"Writer agent initialized with model: {self.model}")
+        logger.info("Writer agent initialized with model: %s", self.model)
 
     def _build_theme_instructions(self, theme: ArticleTheme) -> str:
         """Build theme-specific instructions for the LLM."""
-        instructions = "\n\nCUSTOM THEME PREFERENCES:\n"
-
-        # Theme style instructions
-        style_guidance = {
-            "professional": "Write in a formal, authoritative tone. Use technical terminology appropriately. Focus on credibility and professionalism.",
-            "casual": "Write in a friendly, conversational tone. Use colloquial language where appropriate. Make the content relatable and engaging.",
-            "news": "Write as a journalist would. Focus on facts, objectivity, and newsworthiness. Use the inverted pyramid structure (most important info first).",
-            "how-to": "Write step-by-step instructions. Use imperative language ('Do this', 'Follow this'). Include clear action items and practical guidance.",
-            "opinion": "Include editorial perspective and analysis. Use stronger statements and interpretations. Include thoughtful commentary and expert perspective."
-        }
-        instructions += f"- Theme: {style_guidance.get(theme.theme_style, '')}\n"
-
-        # Article length instructions
-        length_guidance = {
-            "concise": "Keep the article brief and to the point. Aim for ~800-1000 words. Use bullet points and short paragraphs.",
-            "standard": "Write a standard-length article with good depth. Aim for ~1500-2000 words. Balance detail with readability.",
-            "comprehensive": "Create an in-depth, thorough article. Aim for ~2500-3500 words. Include detailed explanations and multiple examples."
-        }
-        instructions += f"- Length: {length_guidance.get(theme.article_length, '')}\n"
-
-        # Audience instructions
-        audience_guidance = {
-            "expert": "Write for experts who have deep domain knowledge. Use technical jargon and advanced concepts. Skip basic explanations.",
-            "beginner": "Write for beginners with minimal background. Explain concepts clearly. Avoid jargon or define all terms used.",
-            "general": "Write for a general audience. Use accessible language. Include brief explanations of concepts that may be unfamiliar."
-        }
-        instructions += f"- Audience: {audience_guidance.get(theme.target_audience, '')}\n"
-
-        # Tone adjustment
-        tone_guidance = {
-            "creative": "Use creative language, metaphors, and engaging examples. Prioritize engagement and entertainment value.",
-            "neutral": "Maintain a balanced, objective tone. Present information without excessive emotion or opinion.",
-            "formal": "Use formal, professional language throughout. Maintain a serious, authoritative tone."
-        }
-        instructions += f"- Tone Adjustment: {tone_guidance.get(theme.tone_adjustment, '')}\n"
-
-        # Visual preferences
-        if theme.visual_preference == "code-heavy":
-            instructions += "- Visual: Include code examples, technical diagrams, and snippets throughout the article. Use code blocks liberally.\n"
-        elif theme.visual_preference == "minimal":
-            instructions += "- Visual: Minimize code blocks and technical diagrams. Focus on prose. Use lists and bold text sparingly.\n"
-        else:
-            instructions += "- Visual: Include a balanced mix of tables, lists, code blocks, and prose. Use visual elements where they enhance understanding.\n"
+        lines = [
+            "",
+            "",
+            "CUSTOM THEME PREFERENCES:",
+            f"- Theme: {_STYLE_GUIDANCE.get(theme.theme_style, '')}",
+            f"- Length: {_LENGTH_GUIDANCE.get(theme.article_length, '')}",
+            f"- Audience: {_AUDIENCE_GUIDANCE.get(theme.target_audience, '')}",
+            f"- Tone Adjustment: {_TONE_GUIDANCE.get(theme.tone_adjustment, '')}",
+            f"- Visual: {_VISUAL_GUIDANCE.get(theme.visual_preference, _VISUAL_GUIDANCE['balanced'])}",
+        ]
 
         # Additional options
         if not theme.use_examples:
-            instructions += "- Avoid including practical examples or case studies.\n"
+            lines.append("- Avoid including practical examples or case studies.")
         if not theme.include_quotes:
-            instructions += "- Minimize or exclude direct quotes from the video transcript.\n"
+            lines.append("- Minimize or exclude direct quotes from the video transcript.")
 
         # Custom focus
         if theme.custom_focus:
-            instructions += f"- Custom Focus: {theme.custom_focus}\n"
+            lines.append(f"- Custom Focus: {theme.custom_focus}")
 
-        return instructions
+        # Terminate the last line so the prompt continues on a fresh line
+        lines.append("")
+        return "\n".join(lines)
 
     def _build_writer_prompt(
         self,
@@ -104,69 +222,232 @@ class WriterAgent:
         analysis: ContentAnalysis,
         theme: Optional[ArticleTheme] = None
     ) -> str:
-        """Build the article writing prompt for the LLM."""
-        sections_description = "\n".join([
-            f"- {section.title}: {section.description}"
-            for section in analysis.suggested_sections
-        ])
+        """
+        Build the per-video user prompt for the LLM.
 
+        Only variable content goes here; the static rubric is in _SYSTEM_PROMPT.
+        Theme preferences come last because they change most often between runs.
+        """
         # Build theme instructions if provided
         theme_instructions = ""
         if theme:
             theme_instructions = self._build_theme_instructions(theme)
 
-        return f"""You are a professional content writer converting video content to a polished article.
-
-VIDEO METADATA:
-- Title: {transcript.title}
-- Channel: {transcript.channel}
-- Duration: {transcript.duration_seconds} seconds
-
-CONTENT ANALYSIS:
-- Main Topic: {analysis.main_topic}
-- Subtopics: {', '.join(analysis.subtopics)}
-- Target Audience: {analysis.target_audience}
-- Tone: {analysis.tone}
-- Reading Time Target: {analysis.estimated_reading_time} minutes
-
-SUGGESTED STRUCTURE:
-{sections_description}
-
-FULL TRANSCRIPT:
-{transcript.transcript}
-
-Write a comprehensive, engaging article following these requirements:
-
-STRUCTURE:
-1. Headline: Create an engaging, SEO-friendly headline (NOT just the video title)
-2. Introduction: Write a hook paragraph that draws readers in (avoid "In this article..." openings)
-3. Body Sections: Follow the {len(analysis.suggested_sections)} suggested sections above
-4. Conclusion: Summarize key takeaways
-
-STYLE REQUIREMENTS:
-- Convert spoken language to polished written prose
-- Remove verbal fillers ("um", "you know", "like", "so", etc.)
-- Transform spoken references ("as I showed you") to written form ("as demonstrated above")
-- Preserve important quotes with proper attribution
-- Use markdown formatting (headers, bold, lists, etc.)
-- Maintain the {analysis.tone} tone
-- Target {analysis.estimated_reading_time} minute read (~{analysis.estimated_reading_time * 200} words)
-{theme_instructions}
-Return the article in proper markdown format with clear section headers (## for main sections)."""
+        metadata_block = (
+            "VIDEO METADATA:\n"
+            f"- Title: {transcript.title}\n"
+            f"- Channel: {transcript.channel}\n"
+            f"- Duration: {transcript.duration_seconds} seconds\n\n"
+        )
+        analysis_block = (
+            "CONTENT ANALYSIS:\n"
+            f"- Main Topic: {analysis.main_topic}\n"
+            f"- Subtopics: {analysis.rendered_subtopics}\n"
+            f"- Target Audience: {analysis.target_audience}\n"
+            f"- Tone: {analysis.tone} (maintain this tone)\n"
+            f"- Reading Time Target: {analysis.estimated_reading_time} minutes "
+            f"(~{analysis.estimated_reading_time * 200} words)\n\n"
+        )
+        structure_block = f"SUGGESTED STRUCTURE:\n{analysis.rendered_sections}\n\n"
+
+        transcript_text = transcript.transcript
+        if self.config.strip_fillers:
+            transcript_text = _FILLER_RE.sub('', _WHITESPACE_RE.sub(' ', transcript_text)).strip()
+        if self.config.compact_transcripts:
+            transcript_text = self._compact_transcript(transcript_text)
+        transcript_block = f"FULL TRANSCRIPT:\n{transcript_text}\n"
+
+        return "".join([
+            metadata_block,
+            analysis_block,
+            structure_block,
+            transcript_block,
+            theme_instructions,
+        ])
 
-    def run(
+    def _compact_transcript(self, text: str) -> str:
+        """
+        Shorten a transcript that exceeds config.max_transcript_tokens.
+
+        The transcript is split into equal runs of sentences. The first and
+        last runs are kept verbatim (up to a quarter of the budget each); the
+        sentences in between are thinned to every n-th sentence, with n chosen
+        so the result fits the token budget.
+        """
+        n_tokens = int(len(text.split()) * _TOKENS_PER_WORD)
+        if n_tokens <= self.config.max_transcript_tokens:
+            return text
+
+        sentences = _SENTENCE_SPLIT_RE.split(text)
+        if len(sentences) < _COMPACT_SEGMENTS:
+            return text
+
+        counts = [len(sentence.split()) for sentence in sentences]
+        budget_words = int(self.config.max_transcript_tokens / _TOKENS_PER_WORD)
+        edge_words = budget_words // 4
+        size = -(-len(sentences) // _COMPACT_SEGMENTS)  # ceil division
+
+        def _edge(indices) -> int:
+            """Number of sentences kept verbatim, walking from one end."""
+            kept = total = 0
+            for i in indices:
+                total += counts[i]
+                if total > edge_words:
+                    break
+                kept += 1
+            return kept
+
+        n_head = _edge(range(size))
+        n_tail = _edge(range(len(sentences) - 1, len(sentences) - 1 - size, -1))
+        middle = sentences[n_head:len(sentences) - n_tail]
+
+        remaining = budget_words - sum(counts[:n_head]) - sum(counts[len(sentences) - n_tail:])
+        middle_words = sum(counts[n_head:len(sentences) - n_tail])
+        stride = max(2, -(-middle_words // max(remaining, 1)))
+
+        compacted = " ".join(sentences[:n_head] + middle[::stride] + sentences[len(sentences) - n_tail:])
+        new_tokens = int(len(compacted.split()) * _TOKENS_PER_WORD)
+        logger.warning(
+            "Transcript compacted from ~%d to ~%d tokens (%.0f%% kept)",
+            n_tokens, new_tokens, 100 * new_tokens / n_tokens
+        )
+        return compacted
+
+    def _build_request(
         self,
         transcript: TranscriptResult,
         analysis: ContentAnalysis,
         theme: Optional[ArticleTheme] = None
-    ) -> Article:
+    ) -> dict:
+        """Build the chat completion arguments shared by the sync and async paths."""
+        prompt = self._build_writer_prompt(transcript, analysis, theme)
+
+        if theme is None:
+            temperature, top_p = _DEFAULT_SAMPLING
+        elif theme.tone_adjustment == "creative":
+            temperature, top_p = _CREATIVE_SAMPLING
+        else:
+            temperature, top_p = _SAMPLING_BY_STYLE.get(theme.theme_style, _DEFAULT_SAMPLING)
+
+        return {
+            "model": self.model,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": self._SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": prompt
+                }
+            ],
+            "max_tokens": self._max_tokens(analysis),
+            "temperature": temperature,
+            "top_p": top_p,
+        }
+
+    def _max_tokens(self, analysis: ContentAnalysis) -> int:
+        """Output token budget for one article."""
+        # ~200 words per minute of reading time, ~1.25 tokens per word of prose,
+        # plus a small fixed margin for headers and markdown syntax
+        target_words = analysis.estimated_reading_time * 200
+        return min(int(target_words * 1.25) + 128, _MAX_OUTPUT_TOKENS)  # Cap at model limit
+
+    def _cache_key(self, request: dict) -> Optional[str]:
         """
-        Generate article from transcript and analysis.
+        Content hash of a completion request, or None if it should not be cached.
+
+        The key covers the model, full prompt and sampling parameters. Output
+        sampled above _CACHEABLE_TEMPERATURE is only cached when
+        config.cache_stochastic is set.
+        """
+        if request["temperature"] > _CACHEABLE_TEMPERATURE and not self.config.cache_stochastic:
+            return None
+        payload = json.dumps(request, sort_keys=True).encode("utf-8")
+        return hashlib.blake2b(payload, digest_size=16).hexdigest()
+
+    def _cache_get(self, key: Optional[str]) -> Optional[str]:
+        """Return cached article markdown for key, if present and not expired."""
+        if key is None:
+            return None
+        try:
+            with _cache_lock, shelve.open(self._cache_path()) as db:
+                entry = db.get(key)
+                if entry is None:
+                    return None
+                if _saved_at(entry) < time.time() - self.config.cache_ttl_hours * 3600:
+                    del db[key]
+                    return None
+                return entry[1]
+        except Exception as e:
+            logger.warning("Article cache read failed: %s", e)
+            return None
+
+    def _cache_put(self, key: Optional[str], article_markdown: str):
+        """Store generated article markdown under key, evicting the oldest entries over the cap."""
+        if key is None:
+            return
+        try:
+            with _cache_lock, shelve.open(self._cache_path()) as db:
+                db[key] = (time.time(), article_markdown)
+                excess = len(db) - self.config.cache_max_entries
+                if excess > 0:
+                    for old_key in sorted(db.keys(), key=lambda k: _saved_at(db[k]))[:excess]:
+                        del db[old_key]
+        except Exception as e:
+            logger.warning("Article cache write failed: %s", e)
+
+    def clear_cache(self):
+        """Clear the article response cache."""
+        with _cache_lock:
+            shelve.open(self._cache_path(), flag="n").close()
+        logger.info("Cleared all article cache")
+
+    def _cache_path(self) -> str:
+        """Path of the shelve database holding cached responses."""
+        cache_dir = Path(self.config.cache_dir)
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        return str(cache_dir / "writer_responses")
+
+    def _finish(self, article_markdown: str) -> Article:
+        """Parse the full generated article text into an Article."""
+        article_markdown = article_markdown.strip()
+
+        logger.debug("Generated article: %d characters", len(article_markdown))
+
+        # Parse article structure
+        article_data = self._parse_article(article_markdown)
+
+        logger.info(
+            "Article generation complete: %d words, %d sections",
+            article_data.word_count, len(article_data.sections)
+        )
+
+        return article_data
+
+    def run_stream(
+        self,
+        transcript: TranscriptResult,
+        analysis: ContentAnalysis,
+        theme: Optional[ArticleTheme] = None,
+        use_cache: bool = True
+    ) -> Generator[ArticleSection, None, Article]:
+        """
+        Generate an article, yielding body sections as soon as they are complete.
+
+        The completion is streamed from the provider. A section is yielded once
+        the next "## " header has arrived; the remainder is yielded when the
+        stream ends. The parsed Article is the generator's return value.
 
         Args:
             transcript: Transcript result from Agent 1
             analysis: Content analysis from Agent 2
             theme: Optional article theme preferences from Stage 2.5
+            use_cache: Serve an identical earlier request from the response cache;
+                False always calls the model (the fresh result is still cached)
+
+        Yields:
+            ArticleSection objects in article order
 
         Returns:
             Article with generated content
@@ -174,140 +455,408 @@ Return the article in proper markdown format with clear section headers (## for
         Raises:
             Exception: If article generation fails
         """
-        logger.info(f"Generating article for video: {transcript.video_id}")
+        logger.info("Generating article for video: %s", transcript.video_id)
 
-        # Build prompt
-        prompt = self._build_writer_prompt(transcript, analysis, theme)
+        request = self._build_request(transcript, analysis, theme)
+
+        cache_key = self._cache_key(request)
+        cached = self._cache_get(cache_key) if use_cache else None
+        if cached is not None:
+            logger.info("Using cached article for identical request")
+            article = self._finish(cached)
+            yield from article.sections
+            return article
 
         # Call HuggingFace Inference API
         try:
-            logger.info(f"Calling {self.model} for article generation...")
-
-            # Calculate max tokens based on estimated reading time
-            # ~200 words per minute, ~1.3 tokens per word
-            max_tokens = int(analysis.estimated_reading_time * 200 * 1.3) + 500
-
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are an expert content writer specializing in transforming video transcripts into engaging, well-structured articles. Write in a clear, professional style."
-                    },
-                    {
-                        "role": "user",
-                        "content": prompt
-                    }
-                ],
-                max_tokens=min(max_tokens, 4000),  # Cap at model limit
-                temperature=0.7,  # Higher temperature for more creative writing
-            )
+            logger.info("Calling %s for article generation...", self.model)
+
+            response = self.client.chat.completions.create(**request, stream=True)
+
+            buf = io.StringIO()
+            scanned = 0  # Offset up to which complete lines were scanned for headers
+            seen_header = False
+            emitted = 0
+
+            for chunk in response:
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if not delta:
+                    continue
+                buf.write(delta)
+                if '\n' not in delta:
+                    continue
+
+                text = buf.getvalue()
+                line_end = text.rfind('\n') + 1
+                boundary = None
+                fences = None
+                for match in _HEADER_RE.finditer(text, scanned, line_end):
+                    if len(match.group(1)) != 2:
+                        continue
+                    if fences is None:
+                        fences = _code_fences(text)
+                    if not _in_fence(fences, match.start()):
+                        boundary = match.start()
+                scanned = line_end
+                if boundary is None:
+                    continue
+
+                # Everything before the newest section header is final
+                if seen_header:
+                    completed = self._parse_article(text[:boundary]).sections
+                    for section in completed[emitted:]:
+                        emitted += 1
+                        yield section
+                seen_header = True
+
+            article_markdown = buf.getvalue()
+            article = self._finish(article_markdown)
+            self._cache_put(cache_key, article_markdown)
+            yield from article.sections[emitted:]
+            return article
 
-            # Extract response text (the full article)
-            article_markdown = response.choices[0].message.content.strip()
+        except Exception as e:
+            logger.error("Article generation failed: %s", e)
+            raise
 
-            logger.debug(f"Generated article: {len(article_markdown)} characters")
+    def run(
+        self,
+        transcript: TranscriptResult,
+        analysis: ContentAnalysis,
+        theme: Optional[ArticleTheme] = None,
+        use_cache: bool = True
+    ) -> Article:
+        """
+        Generate article from transcript and analysis.
 
-            # Parse article structure
-            article_data = self._parse_article(article_markdown)
+        Drains run_stream() and returns the finished article.
 
-            logger.info(
-                f"Article generation complete: {article_data.word_count} words, "
-                f"{len(article_data.sections)} sections"
-            )
+        Args:
+            transcript: Transcript result from Agent 1
+            analysis: Content analysis from Agent 2
+            theme: Optional article theme preferences from Stage 2.5
+            use_cache: Serve an identical earlier request from the response cache;
+                False always calls the model (the fresh result is still cached)
+
+        Returns:
+            Article with generated content
+
+        Raises:
+            Exception: If article generation fails
+        """
+        stream = self.run_stream(transcript, analysis, theme, use_cache=use_cache)
+        while True:
+            try:
+                next(stream)
+            except StopIteration as done:
+                return done.value
+
+    def _pack_batches(
+        self,
+        items: List[Tuple[TranscriptResult, ContentAnalysis, Optional[ArticleTheme]]]
+    ) -> List[List[int]]:
+        """
+        Group item indices into batches that fit a single request.
+
+        A batch is closed when adding the next item would exceed the output
+        token cap or the writer model's context window.
+        """
+        batches: List[List[int]] = []
+        current: List[int] = []
+        out_tokens = in_tokens = 0
+
+        for i, (transcript, analysis, theme) in enumerate(items):
+            item_out = self._max_tokens(analysis)
+            item_in = int(len(self._build_writer_prompt(transcript, analysis, theme).split()) * _TOKENS_PER_WORD)
+
+            fits_output = out_tokens + item_out <= _MAX_OUTPUT_TOKENS
+            fits_context = in_tokens + item_in + out_tokens + item_out <= self.config.writer_context_tokens
+            if current and not (fits_output and fits_context):
+                batches.append(current)
+                current, out_tokens, in_tokens = [], 0, 0
+
+            current.append(i)
+            out_tokens += item_out
+            in_tokens += item_in
 
-            return article_data
+        if current:
+            batches.append(current)
+        return batches
+
+    def _run_packed(
+        self,
+        items: List[Tuple[TranscriptResult, ContentAnalysis, Optional[ArticleTheme]]]
+    ) -> List[Optional[Article]]:
+        """
+        Generate several articles with one LLM call.
+
+        Returns:
+            One entry per item; None where the response held no usable article
+        """
+        requests = [self._build_request(*item) for item in items]
+
+        prompt_parts = [
+            f"Write {len(items)} separate articles, one for each video below. "
+            "Begin each article with a line of the form \"=== ARTICLE N ===\", "
+            "where N is the bracketed number of its video, and follow it with the "
+            "article in markdown.\n\n"
+        ]
+        for i, request in enumerate(requests):
+            prompt_parts.append(f"[{i}] {request['messages'][1]['content']}\n")
+
+        logger.info("Calling %s for batched generation of %d articles...", self.model, len(items))
+
+        response = self.client.chat.completions.create(
+            model=self.model,
+            messages=[
+                {
+                    "role": "system",
+                    "content": self._SYSTEM_PROMPT
+                },
+                {
+                    "role": "user",
+                    "content": "".join(prompt_parts)
+                }
+            ],
+            max_tokens=sum(request["max_tokens"] for request in requests),
+            temperature=min(request["temperature"] for request in requests),
+            top_p=min(request["top_p"] for request in requests),
+        )
+        text = response.choices[0].message.content
+
+        # An index marked more than once is ambiguous and left for a single call
+        chunks = {}
+        matches = list(_BATCH_DELIM_RE.finditer(text))
+        for j, match in enumerate(matches):
+            end = matches[j + 1].start() if j + 1 < len(matches) else len(text)
+            index = int(match.group(1))
+            chunks[index] = "" if index in chunks else text[match.end():end]
+
+        results: List[Optional[Article]] = []
+        for i in range(len(items)):
+            chunk = chunks.get(i, "")
+            results.append(self._finish(chunk) if chunk.strip() else None)
+        return results
+
+    def run_batch(
+        self,
+        items: List[Tuple[TranscriptResult, ContentAnalysis, Optional[ArticleTheme]]]
+    ) -> List[Article]:
+        """
+        Generate articles for several videos, packing them into shared LLM calls.
+
+        Items are grouped so each call fits the model's limits. Any article the
+        batched response does not contain is regenerated with its own run() call.
+
+        Args:
+            items: (transcript, analysis, theme) tuples, one per article
+
+        Returns:
+            Articles in the same order as items
+        """
+        articles: List[Article] = []
+
+        for batch in self._pack_batches(items):
+            batch_items = [items[i] for i in batch]
+            results: List[Optional[Article]] = [None] * len(batch_items)
+
+            if len(batch_items) > 1:
+                try:
+                    results = self._run_packed(batch_items)
+                except Exception as e:
+                    logger.warning("Batched article generation failed, falling back to single calls: %s", e)
+
+            for item, article in zip(batch_items, results):
+                if article is None:
+                    article = self.run(*item)
+                articles.append(article)
+
+        return articles
+
+    async def arun(
+        self,
+        transcript: TranscriptResult,
+        analysis: ContentAnalysis,
+        theme: Optional[ArticleTheme] = None,
+        use_cache: bool = True
+    ) -> Article:
+        """
+        Async variant of run() using AsyncInferenceClient.
+
+        Args:
+            transcript: Transcript result from Agent 1
+            analysis: Content analysis from Agent 2
+            theme: Optional article theme preferences from Stage 2.5
+            use_cache: Serve an identical earlier request from the response cache;
+                False always calls the model (the fresh result is still cached)
+
+        Returns:
+            Article with generated content
+
+        Raises:
+            Exception: If article generation fails
+        """
+        logger.info("Generating article for video: %s", transcript.video_id)
+
+        request = self._build_request(transcript, analysis, theme)
+
+        cache_key = self._cache_key(request)
+        cached = self._cache_get(cache_key) if use_cache else None
+        if cached is not None:
+            logger.info("Using cached article for identical request")
+            return self._finish(cached)
+
+        try:
+            logger.info("Calling %s for article generation (async)...", self.model)
+
+            response = await self.async_client.chat.completions.create(**request)
+
+            article_markdown = response.choices[0].message.content
+            article = self._finish(article_markdown)
+            self._cache_put(cache_key, article_markdown)
+            return article
 
         except Exception as e:
-            logger.error(f"Article generation failed: {e}")
+            logger.error("Article generation failed: %s", e)
             raise
 
-    def _parse_article(self, markdown: str) -> Article:
+    async def arun_batch(
+        self,
+        items: List[Tuple[TranscriptResult, ContentAnalysis, Optional[ArticleTheme]]]
+    ) -> List[Article]:
         """
-        Parse generated article markdown into structured format.
+        Generate several articles concurrently.
+
+        At most config.max_concurrency requests are in flight at once to stay
+        within the provider's rate limit.
 
         Args:
-            markdown: Full article in markdown format
+            items: (transcript, analysis, theme) tuples, one per article
 
         Returns:
-            Article object with structured content
+            Articles in the same order as items
         """
-        lines = markdown.split('\n')
+        semaphore = asyncio.Semaphore(self.config.max_concurrency)
 
-        headline = ""
-        introduction = ""
-        sections = []
-        conclusion = ""
+        async def _limited(item):
+            async with semaphore:
+                return await self.arun(*item)
 
-        current_section = None
-        current_content = []
+        return list(await asyncio.gather(*[_limited(item) for item in items]))
 
-        in_intro = True
+    def _parse_article(self, markdown: str) -> Article:
+        """
+        Parse generated article markdown into structured format.
 
-        for line in lines:
-            line = line.strip()
+        Headers are located with a single regex scan and cut the markdown
+        into spans, which a small state machine then routes to the
+        headline, introduction, sections or conclusion in one pass.
 
-            # Extract headline (first # or top line before content)
-            if line.startswith('# ') and not headline:
-                headline = line[2:].strip()
-                in_intro = True
-                continue
+        Models are built with model_construct() (no validation): every field
+        is a str/int produced right here, so validation could never fail.
 
-            # Section headers (##)
-            if line.startswith('## '):
-                # Save previous section if exists
-                if current_section:
-                    sections.append(ArticleSection(
-                        heading=current_section,
-                        content='\n'.join(current_content).strip(),
-                        word_count=len(' '.join(current_content).split())
-                    ))
-                    current_content = []
-
-                current_section = line[3:].strip()
-                in_intro = False
-
-                # Check if this is conclusion
-                if 'conclusion' in current_section.lower() or 'takeaway' in current_section.lower():
-                    conclusion = current_section
-                    current_section = None
+        Args:
+            markdown: Full article in markdown format
 
+        Returns:
+            Article object with structured content
+        """
+        # Normalize CRLF / CR line endings so header lines end at "\n"
+        if '\r' in markdown:
+            markdown = '\n'.join(markdown.splitlines())
+
+        headline_match = None
+        boundaries = []
+        fences = _code_fences(markdown)
+
+        # The first "# " header is the headline; later ones are plain content.
+        # "#" lines inside fenced code blocks are not headers.
+        for match in _HEADER_RE.finditer(markdown):
+            if _in_fence(fences, match.start()):
                 continue
+            if len(match.group(1)) == 2:
+                boundaries.append(match)
+            elif headline_match is None:
+                headline_match = match
+                boundaries.append(match)
+
+        # Split into (kind, heading, body) spans; leading text is an INTRO span
+        spans = [(_ParseState.INTRO, "", markdown[:boundaries[0].start()] if boundaries else markdown)]
+        for i, match in enumerate(boundaries):
+            end = boundaries[i + 1].start() if i + 1 < len(boundaries) else len(markdown)
+            heading = match.group(2)
+            if match is headline_match:
+                kind = _ParseState.HEADLINE
+            elif 'conclusion' in heading.lower() or 'takeaway' in heading.lower():
+                kind = _ParseState.CONCLUSION
+            else:
+                kind = _ParseState.SECTION
+            spans.append((kind, heading, markdown[match.end():end]))
 
-            # Collect content
-            if line:
-                if in_intro and not current_section:
-                    introduction += line + '\n'
-                elif current_section or conclusion:
-                    current_content.append(line)
-
-        # Save last section
-        if current_section:
-            sections.append(ArticleSection(
-                heading=current_section,
-                content='\n'.join(current_content).strip(),
-                word_count=len(' '.join(current_content).split())
+        headline = ""
+        intro_parts = []
+        section_parts = []
+        conclusion_parts = []
+        state = _ParseState.HEADLINE
+
+        for kind, heading, body in spans:
+            match state, kind:
+                case _, _ParseState.SECTION:
+                    state = _ParseState.SECTION
+                    section_parts.append((heading, [body]))
+                case _, _ParseState.CONCLUSION:
+                    state = _ParseState.CONCLUSION
+                    conclusion_parts.append(body)
+                # A late headline's body continues the block it appears in
+                case _ParseState.SECTION, _ParseState.HEADLINE:
+                    headline = heading
+                    section_parts[-1][1].append(body)
+                case _ParseState.CONCLUSION, _ParseState.HEADLINE:
+                    headline = heading
+                    conclusion_parts.append(body)
+                case _, _ParseState.HEADLINE:
+                    headline = heading
+                    state = _ParseState.INTRO
+                    intro_parts.append(body)
+                case _:
+                    intro_parts.append(body)
+
+        sections = []
+        for heading, parts in section_parts:
+            content = "".join(parts).strip()
+            sections.append(ArticleSection.model_construct(
+                heading=heading,
+                content=content,
+                word_count=len(content.split())
             ))
-        elif conclusion:
-            # Conclusion content
-            conclusion = '\n'.join(current_content).strip()
 
-        # Calculate total word count
-        total_words = len(markdown.split())
+        introduction = "".join(intro_parts).strip()
+        conclusion = "".join(conclusion_parts).strip()
 
-        # If no structured sections found, create one section from all content
-        if not sections:
-            sections.append(ArticleSection(
+        if sections:
+            # Total from the per-part counts rather than re-splitting the whole article
+            total_words = (
+                len(headline.split())
+                + len(introduction.split())
+                + sum(section.word_count for section in sections)
+                + len(conclusion.split())
+            )
+        else:
+            # If no structured sections found, create one section from all content
+            total_words = len(markdown.split())
+            sections.append(ArticleSection.model_construct(
                 heading="Content",
                 content=markdown,
                 word_count=total_words
             ))
 
-        return Article(
+        return Article.model_construct(
             headline=headline or "Untitled Article",
-            introduction=introduction.strip(),
+            introduction=introduction,
             sections=sections,
-            conclusion=conclusion.strip(),
+            conclusion=conclusion,
             markdown=markdown,
             word_count=total_words
         )
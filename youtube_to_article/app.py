@@ -12,13 +12,23 @@ Multi-stage workflow with approval checkpoints:
 import streamlit as st
 import logging
 from pathlib import Path
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
+import hashlib
+import html
 import sys
 import os
+import threading
+import time
+from string import Template
 from dotenv import load_dotenv
+import orjson
 
 # Add project root to path
 sys.path.insert(0, str(Path(__file__).parent))
 
+from models.schemas import ArticleSection, ArticleTheme, SectionOutline
+
 # Validate .env file exists before proceeding
 env_file = Path(__file__).parent / '.env'
 env_example = Path(__file__).parent / '.env.example'
@@ -80,9 +90,6 @@ except Exception as e:
     st.error(f"⚠️ Error loading environment variables: {e}")
     st.stop()
 
-from pipeline import create_pipeline
-from models.schemas import *
-
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -90,6 +97,150 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+
+@st.cache_resource(show_spinner=False)
+def get_pipeline():
+    """Create the pipeline once per process and share it across sessions."""
+    # Imported here so the URL input page never loads the agents' dependencies
+    from pipeline import create_pipeline
+    return create_pipeline()
+
+
+@st.cache_resource(show_spinner=False)
+def get_executor():
+    """Worker pool that runs long pipeline stages off the script thread."""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="pipeline")
+
+
+@st.cache_resource(show_spinner=False)
+def _gpu_lock():
+    """Process-wide lock so only one session runs Whisper on the GPU at a time."""
+    return threading.Lock()
+
+
+@st.cache_resource(show_spinner=False)
+def _hf_slots():
+    """Process-wide cap on concurrent Hugging Face Inference requests."""
+    return threading.BoundedSemaphore(get_pipeline().config.max_concurrency)
+
+
+def _transcript_key(transcript) -> str:
+    """Content hash of a transcript; edited transcripts get a new key."""
+    return hashlib.blake2b(transcript.model_dump_json().encode("utf-8"), digest_size=16).hexdigest()
+
+
+# Large artifacts live in one process-wide store; session_state only keeps
+# their key, so sessions on the same video share a single copy
+_ARTIFACT_STORE_SIZE = 64
+
+
+@st.cache_resource(show_spinner=False)
+def _artifact_store():
+    """LRU of stage artifacts keyed by content hash, with its lock."""
+    return OrderedDict(), threading.Lock()
+
+
+def get_transcript():
+    """Return this session's transcript, or None if none (or evicted)."""
+    key = st.session_state.transcript_key
+    if key is None:
+        return None
+    store, lock = _artifact_store()
+    with lock:
+        transcript = store.get(key)
+        if transcript is not None:
+            store.move_to_end(key)
+    return transcript
+
+
+def set_transcript(transcript):
+    """
+    Store a transcript and point this session at it.
+
+    Stored transcripts are shared between sessions, so edits must go through
+    a copy passed here rather than mutating the stored object.
+    """
+    key = None if transcript is None else _transcript_key(transcript)
+    if key != st.session_state.transcript_key:
+        # Everything downstream was built from the old transcript
+        clear_downstream()
+        # Segments never change once stored, so build the preview rows once here
+        st.session_state.segments_preview = [] if transcript is None else [
+            segment.model_dump(include={"start", "end", "text"})
+            for segment in transcript.segments[:10]
+        ]
+    if key is None:
+        st.session_state.transcript_key = None
+        return
+    store, lock = _artifact_store()
+    with lock:
+        store[key] = transcript
+        store.move_to_end(key)
+        while len(store) > _ARTIFACT_STORE_SIZE:
+            store.popitem(last=False)
+    st.session_state.transcript_key = key
+
+
+# Stage results cached across sessions, so revisiting a video (or backing up
+# and re-approving) is a lookup instead of another download / LLM call.
+# Transcripts are passed underscore-prefixed (unhashed) next to their key.
+# Entries expire after an hour so idle results do not pin memory.
+@st.cache_data(show_spinner=False, max_entries=32, ttl=3600)
+def _cached_transcribe(url: str, force_whisper: bool):
+    with _gpu_lock():
+        return get_pipeline().stage1_transcribe(url, force_whisper=force_whisper)
+
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl=3600)
+def _cached_filter(transcript_key: str, _transcript):
+    return get_pipeline().stage1_5_filter(_transcript)
+
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl=3600)
+def _cached_analyze(transcript_key: str, _transcript):
+    with _hf_slots():
+        return get_pipeline().stage2_analyze(_transcript)
+
+
+# Analysis, article and SEO models are hashed by content, so any edit
+# made in the UI produces a new cache entry
+@st.cache_data(show_spinner=False, max_entries=32, ttl=3600)
+def _cached_seo(transcript_key: str, _transcript, article, analysis):
+    with _hf_slots():
+        return get_pipeline().stage4_optimize_seo(article, analysis, _transcript)
+
+
+@st.cache_data(show_spinner=False, max_entries=32, ttl=3600)
+def _cached_assess(article, analysis, seo):
+    return get_pipeline().stage5_assess_quality(article, analysis, seo)
+
+
+def _section_markdown(stream, result: list):
+    """
+    Yield streamed ArticleSections as markdown for st.write_stream.
+
+    The Article the stream returns when it finishes is appended to result.
+    """
+    while True:
+        try:
+            section = next(stream)
+        except StopIteration as done:
+            result.append(done.value)
+            return
+        yield f"## {section.heading}\n\n{section.content}\n\n"
+
+
+def _prefetch_filter():
+    """
+    Start content filtering for the current transcript in the background.
+
+    Runs while the user reviews the transcript; stage 2 picks up the result
+    if the transcript was not edited in the meantime.
+    """
+    key = st.session_state.transcript_key
+    st.session_state.filter_future = (key, get_executor().submit(_cached_filter, key, get_transcript()))
+
+
 # YouTube Theme Colors
 YOUTUBE_RED = "#FF0000"
 YOUTUBE_DARK = "#1a1a1a"
@@ -100,6 +251,64 @@ ACCENT_BLUE = "#4B8FE0"
 ACCENT_GREEN = "#0F9D58"
 ACCENT_ORANGE = "#F08C21"
 
+# Quality rating -> background color of the stage 7 score card
+RATING_COLORS = {
+    "excellent": "#0F9D58",
+    "good": "#4285F4",
+    "fair": "#F9AB00",
+    "poor": "#EA4335"
+}
+
+# Characters of transcript shown on stage 1 before the full-text expander
+_TRANSCRIPT_PREVIEW_CHARS = 2000
+
+# Workflow stages, indexed by st.session_state.stage
+_STAGE_NAMES = ("📝 Input", "🎤 Transcribe", "🔒 Filter", "🔍 Analyze", "🎨 Theme", "✍️ Write", "🚀 SEO", "✅ QA", "📦 Complete")
+
+# Progress indicator cell; state is done (green), cur (red, pulsing) or todo (gray)
+_STAGE_CELL = '<div class="stage-cell {state}">{name}</div>'
+
+# Progress bar followed by the row of stage cells; styled by .stage-progress in the theme CSS
+_PROGRESS_TMPL = (
+    '<div class="stage-progress">'
+    '<div class="stage-bar"><div class="stage-bar-fill" style="width: {bar_pct}%;"></div></div>'
+    '<div class="stage-cells">{cells}</div>'
+    '</div>'
+)
+
+# Small centered metric card (label above a colored value)
+_METRIC_CARD = (
+    '<div style="background-color: #252525; border: 1px solid #303030; border-radius: 8px; padding: 1rem; text-align: center;">'
+    '<div style="color: #c8c8c8; font-size: 0.85rem; margin-bottom: 0.5rem;">{label}</div>'
+    '<div style="color: {color}; font-size: 1.5rem; font-weight: 700;">{value}</div>'
+    '</div>'
+)
+
+# Stage 7 quality score card, rendered as an image
+_RATING_CARD_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg" width="320" height="170" viewBox="0 0 320 170">'
+    '<rect width="320" height="170" rx="8" fill="{color}"/>'
+    '<g fill="white" font-family="sans-serif" text-anchor="middle">'
+    '<text x="160" y="70" font-size="48" font-weight="700">{score:.1f}</text>'
+    '<text x="160" y="110" font-size="20" font-weight="600">Quality Score</text>'
+    '<text x="160" y="145" font-size="18" letter-spacing="1">{rating}</text>'
+    '</g></svg>'
+)
+
+# Workflow overview shown in the landing page hero: (title, caption, color, background)
+_HERO_STEP = (
+    '<div style="padding: 0.75rem; background-color: {background}; border-left: 3px solid {color}; border-radius: 4px;">'
+    '<strong style="color: {color};">{title}</strong>'
+    '<p style="color: #b0b0b0; font-size: 0.85rem; margin-top: 0.25rem;">{caption}</p>'
+    '</div>'
+)
+_HERO_STEPS = (
+    ("1. Input URL", "📝 Paste video link", "#FF0000", "rgba(255, 0, 0, 0.1)"),
+    ("2. Extract", "🎤 Get transcript", "#4B8FE0", "rgba(75, 143, 224, 0.1)"),
+    ("3. Process", "✍️ Generate article", "#0F9D58", "rgba(15, 157, 88, 0.1)"),
+    ("4. Optimize", "🚀 SEO & export", "#F08C21", "rgba(240, 140, 33, 0.1)"),
+)
+
 # Page config
 st.set_page_config(
     page_title="YouTube to Article Converter",
@@ -108,75 +317,75 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
-# Custom CSS for YouTube theme
-st.markdown(f"""
+# Custom CSS for YouTube theme; ${...} placeholders are the theme colors
+_THEME_CSS = Template("""
 <style>
-    * {{
+    * {
         margin: 0;
         padding: 0;
         box-sizing: border-box;
-    }}
+    }
 
     /* Main theme */
-    .stApp {{
-        background: linear-gradient(135deg, {YOUTUBE_DARKER} 0%, {YOUTUBE_DARK} 100%);
+    .stApp {
+        background: linear-gradient(135deg, ${YOUTUBE_DARKER} 0%, ${YOUTUBE_DARK} 100%);
         color: #e0e0e0;
         font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-    }}
+    }
 
     /* Headers - Better typography */
-    h1 {{
+    h1 {
         color: white !important;
         font-size: 2.5rem !important;
         font-weight: 700 !important;
         letter-spacing: -0.5px !important;
         margin-bottom: 1rem !important;
         margin-top: 1.5rem !important;
-    }}
+    }
 
-    h2 {{
+    h2 {
         color: white !important;
         font-size: 1.8rem !important;
         font-weight: 600 !important;
         letter-spacing: -0.25px !important;
         margin-bottom: 0.75rem !important;
         margin-top: 1.25rem !important;
-    }}
+    }
 
-    h3 {{
+    h3 {
         color: #e0e0e0 !important;
         font-size: 1.3rem !important;
         font-weight: 600 !important;
         margin-bottom: 0.5rem !important;
         margin-top: 1rem !important;
-    }}
+    }
 
-    h4, h5, h6 {{
+    h4, h5, h6 {
         color: #b0b0b0 !important;
         font-weight: 600 !important;
-    }}
+    }
 
     /* Text */
-    p {{
+    p {
         color: #c8c8c8;
         line-height: 1.6;
-    }}
+    }
 
     /* Links */
-    a {{
-        color: {ACCENT_BLUE} !important;
+    a {
+        color: ${ACCENT_BLUE} !important;
         text-decoration: none;
         transition: color 0.2s ease;
-    }}
+    }
 
-    a:hover {{
+    a:hover {
         color: #6fa3e8 !important;
         text-decoration: underline;
-    }}
+    }
 
     /* Buttons - Enhanced styling */
-    .stButton > button {{
-        background-color: {YOUTUBE_RED};
+    .stButton > button {
+        background-color: ${YOUTUBE_RED};
         color: white;
         border: none;
         border-radius: 6px;
@@ -187,26 +396,26 @@ st.markdown(f"""
         box-shadow: 0 4px 12px rgba(255, 0, 0, 0.25);
         cursor: pointer;
         letter-spacing: 0.5px;
-    }}
+    }
 
-    .stButton > button:hover {{
+    .stButton > button:hover {
         background-color: #e60000;
         transform: translateY(-2px);
         box-shadow: 0 6px 16px rgba(255, 0, 0, 0.35);
-    }}
+    }
 
-    .stButton > button:active {{
+    .stButton > button:active {
         transform: translateY(0);
         box-shadow: 0 2px 8px rgba(255, 0, 0, 0.25);
-    }}
+    }
 
     /* Primary button variant */
-    .stButton > button[data-testid="baseButton-primary"] {{
-        background: linear-gradient(135deg, {YOUTUBE_RED} 0%, #e60000 100%);
-    }}
+    .stButton > button[data-testid="baseButton-primary"] {
+        background: linear-gradient(135deg, ${YOUTUBE_RED} 0%, #e60000 100%);
+    }
 
     /* Input fields - Enhanced styling */
-    .stTextInput > div > div > input {{
+    .stTextInput > div > div > input {
         background-color: #1e1e1e;
         color: white;
         border: 2px solid #303030;
@@ -215,20 +424,20 @@ st.markdown(f"""
         font-size: 0.95rem;
         transition: all 0.3s ease;
         line-height: 1.5;
-    }}
+    }
 
-    .stTextInput > div > div > input:focus {{
-        border-color: {ACCENT_BLUE};
+    .stTextInput > div > div > input:focus {
+        border-color: ${ACCENT_BLUE};
         box-shadow: 0 0 0 3px rgba(75, 143, 224, 0.1);
         background-color: #252525;
-    }}
+    }
 
-    .stTextInput > div > div > input::placeholder {{
+    .stTextInput > div > div > input::placeholder {
         color: #666666;
-    }}
+    }
 
     /* Text areas - Enhanced styling */
-    .stTextArea > div > div > textarea {{
+    .stTextArea > div > div > textarea {
         background-color: #1e1e1e;
         color: white;
         border: 2px solid #303030;
@@ -238,389 +447,421 @@ st.markdown(f"""
         transition: all 0.3s ease;
         line-height: 1.6;
         font-family: 'SF Mono', Monaco, 'Cascadia Code', 'Roboto Mono', Consolas, 'Courier New', monospace;
-    }}
+    }
 
-    .stTextArea > div > div > textarea:focus {{
-        border-color: {ACCENT_BLUE};
+    .stTextArea > div > div > textarea:focus {
+        border-color: ${ACCENT_BLUE};
         box-shadow: 0 0 0 3px rgba(75, 143, 224, 0.1);
         background-color: #252525;
-    }}
+    }
 
-    .stTextArea > div > div > textarea::placeholder {{
+    .stTextArea > div > div > textarea::placeholder {
         color: #666666;
-    }}
+    }
 
     /* Select inputs */
-    .stSelectbox > div > div > select {{
+    .stSelectbox > div > div > select {
         background-color: #1e1e1e;
         color: white;
         border: 2px solid #303030;
         border-radius: 6px;
         padding: 0.7rem 0.9rem;
         transition: all 0.3s ease;
-    }}
+    }
 
-    .stSelectbox > div > div > select:focus {{
-        border-color: {ACCENT_BLUE};
+    .stSelectbox > div > div > select:focus {
+        border-color: ${ACCENT_BLUE};
         outline: none;
-    }}
+    }
 
     /* Checkboxes and Radio buttons */
-    .stCheckbox {{
+    .stCheckbox {
         color: #c8c8c8;
-    }}
+    }
 
-    .stCheckbox > label > span {{
+    .stCheckbox > label > span {
         font-weight: 500;
-    }}
+    }
 
-    .stRadio {{
+    .stRadio {
         color: #c8c8c8;
-    }}
+    }
 
     /* Success/Info/Warning/Error boxes - Enhanced cards */
-    .stSuccess {{
+    .stSuccess {
         background-color: rgba(15, 157, 88, 0.15);
-        border: 2px solid {ACCENT_GREEN};
+        border: 2px solid ${ACCENT_GREEN};
         border-radius: 8px;
         padding: 1rem !important;
         color: #e0e0e0 !important;
-    }}
+    }
 
-    .stInfo {{
+    .stInfo {
         background-color: rgba(75, 143, 224, 0.15);
-        border: 2px solid {ACCENT_BLUE};
+        border: 2px solid ${ACCENT_BLUE};
         border-radius: 8px;
         padding: 1rem !important;
         color: #e0e0e0 !important;
-    }}
+    }
 
-    .stWarning {{
+    .stWarning {
         background-color: rgba(240, 140, 33, 0.15);
-        border: 2px solid {ACCENT_ORANGE};
+        border: 2px solid ${ACCENT_ORANGE};
         border-radius: 8px;
         padding: 1rem !important;
         color: #e0e0e0 !important;
-    }}
+    }
 
-    .stError {{
+    .stError {
         background-color: rgba(255, 0, 0, 0.15);
-        border: 2px solid {YOUTUBE_RED};
+        border: 2px solid ${YOUTUBE_RED};
         border-radius: 8px;
         padding: 1rem !important;
         color: #ff6b6b !important;
-    }}
+    }
 
     /* Progress bar - Enhanced */
-    .stProgress > div > div > div > div {{
-        background: linear-gradient(90deg, {YOUTUBE_RED} 0%, #ff3333 100%);
+    .stProgress > div > div > div > div {
+        background: linear-gradient(90deg, ${YOUTUBE_RED} 0%, #ff3333 100%);
         border-radius: 4px;
-    }}
+    }
 
-    .stProgress {{
+    .stProgress {
         height: 6px;
-    }}
+    }
 
     /* Sidebar - Enhanced */
-    section[data-testid="stSidebar"] {{
+    section[data-testid="stSidebar"] {
         background: linear-gradient(135deg, #1a1a1a 0%, #1e1e1e 100%);
         border-right: 1px solid #303030;
-    }}
+    }
 
-    section[data-testid="stSidebar"] > div > div:first-child {{
+    section[data-testid="stSidebar"] > div > div:first-child {
         padding-top: 2rem;
-    }}
+    }
 
     /* Sidebar text */
     section[data-testid="stSidebar"] h1,
     section[data-testid="stSidebar"] h2,
-    section[data-testid="stSidebar"] h3 {{
+    section[data-testid="stSidebar"] h3 {
         color: white !important;
-    }}
+    }
 
     /* Sidebar links */
-    section[data-testid="stSidebar"] a {{
-        color: {ACCENT_BLUE};
-    }}
+    section[data-testid="stSidebar"] a {
+        color: ${ACCENT_BLUE};
+    }
 
     /* Expanders - Better styling */
-    .streamlit-expanderHeader {{
+    .streamlit-expanderHeader {
         background-color: #252525;
         border: 1px solid #303030;
         border-radius: 6px;
         padding: 0.75rem !important;
         transition: all 0.2s ease;
-    }}
+    }
 
-    .streamlit-expanderHeader:hover {{
+    .streamlit-expanderHeader:hover {
         background-color: #2d2d2d;
-        border-color: {ACCENT_BLUE};
-    }}
+        border-color: ${ACCENT_BLUE};
+    }
 
-    .streamlit-expanderContent {{
+    .streamlit-expanderContent {
         background-color: #1e1e1e;
         border: 1px solid #303030;
         border-top: none;
         border-radius: 0 0 6px 6px;
         padding: 1rem !important;
-    }}
+    }
 
     /* Metric boxes - Card styling */
-    .metric-card {{
+    .metric-card {
         background-color: #252525;
         border: 1px solid #303030;
         border-radius: 8px;
         padding: 1.5rem;
         transition: all 0.3s ease;
-    }}
+    }
 
-    .metric-card:hover {{
-        border-color: {ACCENT_BLUE};
+    .metric-card:hover {
+        border-color: ${ACCENT_BLUE};
         box-shadow: 0 4px 12px rgba(75, 143, 224, 0.1);
-    }}
+    }
 
     /* Divider */
-    hr {{
+    hr {
         border: none;
         border-top: 1px solid #303030;
         margin: 1.5rem 0;
-    }}
+    }
 
     /* Code blocks */
-    .stCodeBlock {{
+    .stCodeBlock {
         background-color: #0d0d0d;
         border: 1px solid #303030;
         border-radius: 6px;
         padding: 1rem;
-    }}
+    }
 
-    pre {{
+    pre {
         background-color: #1a1a1a;
         border: 1px solid #303030;
         border-radius: 6px;
         padding: 1rem;
         overflow-x: auto;
-    }}
+    }
 
-    code {{
+    code {
         background-color: #252525;
         color: #e0e0e0;
         padding: 0.25rem 0.5rem;
         border-radius: 3px;
         font-family: 'SF Mono', Monaco, 'Cascadia Code', 'Roboto Mono', Consolas, 'Courier New', monospace;
         font-size: 0.85rem;
-    }}
+    }
 
-    pre code {{
+    pre code {
         background-color: transparent;
         padding: 0;
-    }}
+    }
 
     /* Tables */
-    .dataframe {{
+    .dataframe {
         background-color: #1e1e1e;
         color: #c8c8c8;
-    }}
+    }
 
-    .dataframe th {{
+    .dataframe th {
         background-color: #252525;
         color: white;
         border-color: #303030;
         font-weight: 600;
-    }}
+    }
 
-    .dataframe td {{
+    .dataframe td {
         border-color: #303030;
         color: #c8c8c8;
-    }}
+    }
 
     /* Columns and containers */
-    .stColumn {{
+    .stColumn {
         padding-right: 0.5rem;
         padding-left: 0.5rem;
-    }}
+    }
 
     /* General container styling */
-    .element-container {{
+    .element-container {
         color: #c8c8c8;
         line-height: 1.6;
-    }}
+    }
 
     /* Custom card container */
-    .custom-card {{
+    .custom-card {
         background-color: #252525;
         border: 1px solid #303030;
         border-radius: 8px;
         padding: 1.5rem;
         margin-bottom: 1rem;
         transition: all 0.3s ease;
-    }}
+    }
 
-    .custom-card:hover {{
-        border-color: {ACCENT_BLUE};
+    .custom-card:hover {
+        border-color: ${ACCENT_BLUE};
         box-shadow: 0 4px 12px rgba(75, 143, 224, 0.1);
-    }}
+    }
+
+    /* Content-filter flags rendered as native disclosure blocks */
+    details.flag-details {
+        background-color: #252525;
+        border: 1px solid #303030;
+        border-radius: 6px;
+        padding: 0.75rem;
+        margin-bottom: 0.5rem;
+    }
+
+    details.flag-details > summary {
+        cursor: pointer;
+        font-weight: 600;
+        color: #e0e0e0;
+    }
+
+    details.flag-details[open] > summary {
+        margin-bottom: 0.5rem;
+    }
+
+    /* Stage progress indicator: bar, then one cell per stage */
+    .stage-progress {
+        margin-bottom: 1.5rem;
+    }
+
+    .stage-bar {
+        background-color: #303030;
+        height: 4px;
+        border-radius: 2px;
+        overflow: hidden;
+        margin-bottom: 1.5rem;
+    }
+
+    .stage-bar-fill {
+        background: linear-gradient(90deg, ${YOUTUBE_RED} 0%, #ff3333 100%);
+        height: 100%;
+        transition: width 0.5s ease;
+        border-radius: 2px;
+    }
+
+    .stage-cells {
+        display: flex;
+        justify-content: space-between;
+        gap: 0.25rem;
+        flex-wrap: wrap;
+    }
+
+    .stage-cell {
+        flex: 1;
+        border: 2px solid;
+        border-radius: 6px;
+        padding: 0.6rem 0.4rem;
+        text-align: center;
+        font-size: 0.75rem;
+    }
+
+    .stage-cell.done {
+        background: linear-gradient(135deg, ${ACCENT_GREEN} 0%, #089d42 100%);
+        border-color: ${ACCENT_GREEN};
+        font-weight: 600;
+        color: white;
+        box-shadow: 0 2px 8px rgba(15, 157, 88, 0.3);
+    }
 
-    /* Smooth transitions */
-    * {{
-        transition-property: background-color, border-color, color, box-shadow;
-        transition-duration: 0.2s;
-        transition-timing-function: ease;
-    }}
+    .stage-cell.cur {
+        background: linear-gradient(135deg, ${YOUTUBE_RED} 0%, #ff3333 100%);
+        border-color: ${YOUTUBE_RED};
+        font-weight: 700;
+        color: white;
+        box-shadow: 0 2px 12px rgba(255, 0, 0, 0.4);
+        animation: pulse 2s infinite;
+    }
+
+    .stage-cell.todo {
+        background-color: #303030;
+        border-color: #404040;
+        font-weight: 500;
+        color: #808080;
+        transition: all 0.3s ease;
+    }
+
+    /* Current stage highlight in the progress indicator */
+    @keyframes pulse {
+        0%, 100% { box-shadow: 0 2px 12px rgba(255, 0, 0, 0.4); }
+        50% { box-shadow: 0 4px 20px rgba(255, 0, 0, 0.6); }
+    }
 
-    input, textarea, select, button {{
+    /* Smooth transitions on interactive controls only */
+    input, textarea, select, button {
         transition-property: all;
         transition-duration: 0.3s;
         transition-timing-function: cubic-bezier(0.4, 0, 0.2, 1);
-    }}
+    }
 </style>
-""", unsafe_allow_html=True)
+""")
+
+
+@st.cache_resource(show_spinner=False)
+def _theme_css() -> str:
+    """
+    Resolve the theme stylesheet once per process.
+
+    Streamlit drops elements that a rerun does not emit again, so the
+    <style> block is still written on every rerun; only the substitution
+    is cached. cache_resource hands back the same string each time rather
+    than unpickling a copy as cache_data would.
+    """
+    return _THEME_CSS.substitute(
+        YOUTUBE_RED=YOUTUBE_RED,
+        YOUTUBE_DARK=YOUTUBE_DARK,
+        YOUTUBE_DARKER=YOUTUBE_DARKER,
+        ACCENT_BLUE=ACCENT_BLUE,
+        ACCENT_GREEN=ACCENT_GREEN,
+        ACCENT_ORANGE=ACCENT_ORANGE,
+    )
+
+
+st.markdown(_theme_css(), unsafe_allow_html=True)
+
+
+# Session state defaults; reset_workflow restores all of them
+_DEFAULTS = {
+    'stage': 0,  # 0=input, 1=transcribe, 2=filter, 3=analyze, 4=theme, 5=write, 6=seo, 7=qa, 8=complete
+    'transcript_key': None,
+    'content_filter': None,
+    'analysis': None,
+    'theme': None,
+    'article': None,
+    'regenerate_article': False,  # Next stage 5 run bypasses the writer's response cache
+    'seo': None,
+    'quality_assessment': None,
+    'youtube_url': "",
+    'transcribe_future': None,
+    'filter_future': None,
+    'editing_transcript': False,
+    'show_full_md': False,
+    'show_full_transcript': False,
+    'segments_preview': [],
+}
 
 
 # Initialize session state
 def init_session_state():
     """Initialize session state variables."""
-    if 'stage' not in st.session_state:
-        st.session_state.stage = 0  # 0=input, 1=transcribe, 2=filter, 3=analyze, 4=theme, 5=write, 6=seo, 7=qa, 8=complete
-    if 'pipeline' not in st.session_state:
-        st.session_state.pipeline = None
-    if 'transcript' not in st.session_state:
-        st.session_state.transcript = None
-    if 'content_filter' not in st.session_state:
-        st.session_state.content_filter = None
-    if 'analysis' not in st.session_state:
-        st.session_state.analysis = None
-    if 'theme' not in st.session_state:
-        st.session_state.theme = None
-    if 'article' not in st.session_state:
-        st.session_state.article = None
-    if 'seo' not in st.session_state:
-        st.session_state.seo = None
-    if 'quality_assessment' not in st.session_state:
-        st.session_state.quality_assessment = None
-    if 'youtube_url' not in st.session_state:
-        st.session_state.youtube_url = ""
+    for key, value in _DEFAULTS.items():
+        st.session_state.setdefault(key, value)
 
 
 def reset_workflow():
     """Reset workflow to start."""
-    st.session_state.stage = 0
-    st.session_state.transcript = None
-    st.session_state.content_filter = None
-    st.session_state.analysis = None
-    st.session_state.theme = None
-    st.session_state.article = None
-    st.session_state.seo = None
-    st.session_state.quality_assessment = None
-    st.session_state.youtube_url = ""
+    st.session_state.update(_DEFAULTS)
 
 
-def show_progress():
-    """Show progress indicator with enhanced styling."""
-    stages = ["📝 Input", "🎤 Transcribe", "🔒 Filter", "🔍 Analyze", "🎨 Theme", "✍️ Write", "🚀 SEO", "✅ QA", "📦 Complete"]
-    current_stage = st.session_state.stage
+# Stage outputs in pipeline order; each one is built from those before it
+_ARTIFACTS = ("content_filter", "analysis", "theme", "article", "seo", "quality_assessment")
 
-    # Create visual progress bar
-    st.markdown(f"""
-    <div style="margin-bottom: 1.5rem;">
-        <div style="
-            background-color: #303030;
-            height: 4px;
-            border-radius: 2px;
-            overflow: hidden;
-            margin-bottom: 1.5rem;
-        ">
-            <div style="
-                background: linear-gradient(90deg, #FF0000 0%, #ff3333 100%);
-                height: 100%;
-                width: {(current_stage / len(stages)) * 100}%;
-                transition: width 0.5s ease;
-                border-radius: 2px;
-            "></div>
-        </div>
-        <div style="
-            display: flex;
-            justify-content: space-between;
-            gap: 0.25rem;
-            flex-wrap: wrap;
-        ">
-    """, unsafe_allow_html=True)
 
-    cols = st.columns(len(stages), gap="small")
-    for i, (col, stage_name) in enumerate(zip(cols, stages)):
-        with col:
-            if i < current_stage:
-                # Completed stages - green with checkmark
-                st.markdown(f"""
-                <div style="
-                    background: linear-gradient(135deg, #0F9D58 0%, #089d42 100%);
-                    border: 2px solid #0F9D58;
-                    border-radius: 6px;
-                    padding: 0.6rem 0.4rem;
-                    text-align: center;
-                    font-weight: 600;
-                    font-size: 0.75rem;
-                    color: white;
-                    box-shadow: 0 2px 8px rgba(15, 157, 88, 0.3);
-                ">
-                    {stage_name}
-                </div>
-                """, unsafe_allow_html=True)
-            elif i == current_stage:
-                # Current stage - red with highlight
-                st.markdown(f"""
-                <div style="
-                    background: linear-gradient(135deg, #FF0000 0%, #ff3333 100%);
-                    border: 2px solid #FF0000;
-                    border-radius: 6px;
-                    padding: 0.6rem 0.4rem;
-                    text-align: center;
-                    font-weight: 700;
-                    font-size: 0.75rem;
-                    color: white;
-                    box-shadow: 0 2px 12px rgba(255, 0, 0, 0.4);
-                    animation: pulse 2s infinite;
-                ">
-                    {stage_name}
-                </div>
-                """, unsafe_allow_html=True)
-            else:
-                # Future stages - gray
-                st.markdown(f"""
-                <div style="
-                    background-color: #303030;
-                    border: 2px solid #404040;
-                    border-radius: 6px;
-                    padding: 0.6rem 0.4rem;
-                    text-align: center;
-                    font-weight: 500;
-                    font-size: 0.75rem;
-                    color: #808080;
-                    transition: all 0.3s ease;
-                ">
-                    {stage_name}
-                </div>
-                """, unsafe_allow_html=True)
-
-    st.markdown("</div>", unsafe_allow_html=True)
-
-    # Add animation keyframes
-    st.markdown("""
-    <style>
-        @keyframes pulse {
-            0%, 100% { box-shadow: 0 2px 12px rgba(255, 0, 0, 0.4); }
-            50% { box-shadow: 0 4px 20px rgba(255, 0, 0, 0.6); }
-        }
-    </style>
-    """, unsafe_allow_html=True)
+def clear_downstream(artifact=None):
+    """Drop the artifacts built from `artifact` (all of them if None)."""
+    start = 0 if artifact is None else _ARTIFACTS.index(artifact) + 1
+    for name in _ARTIFACTS[start:]:
+        st.session_state[name] = None
+
+
+@st.cache_data(show_spinner=False)
+def _progress_html(current_stage: int) -> str:
+    """Build the progress indicator markup; at most one build per stage."""
+    cells = "".join(
+        _STAGE_CELL.format(
+            state="done" if i < current_stage else "cur" if i == current_stage else "todo",
+            name=name
+        )
+        for i, name in enumerate(_STAGE_NAMES)
+    )
+    return _PROGRESS_TMPL.format(bar_pct=current_stage / len(_STAGE_NAMES) * 100, cells=cells)
 
 
+def show_progress():
+    """Show progress indicator with enhanced styling."""
+    st.markdown(_progress_html(st.session_state.stage), unsafe_allow_html=True)
+
+
+@st.fragment
 def stage0_input():
     """Stage 0: YouTube URL Input"""
     st.title("🎥 YouTube to Article Converter")
 
     # Hero section with better styling
-    st.markdown("""
+    hero_steps = "".join(
+        _HERO_STEP.format(title=title, caption=caption, color=color, background=background)
+        for title, caption, color, background in _HERO_STEPS
+    )
+    st.markdown(f"""
     <div style="
         background: linear-gradient(135deg, rgba(255, 0, 0, 0.1) 0%, rgba(75, 143, 224, 0.05) 100%);
         border: 1px solid rgba(75, 143, 224, 0.3);
@@ -637,22 +878,7 @@ def stage0_input():
             grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
             gap: 1rem;
         ">
-            <div style="padding: 0.75rem; background-color: rgba(255, 0, 0, 0.1); border-left: 3px solid #FF0000; border-radius: 4px;">
-                <strong style="color: #FF0000;">1. Input URL</strong>
-                <p style="color: #b0b0b0; font-size: 0.85rem; margin-top: 0.25rem;">📝 Paste video link</p>
-            </div>
-            <div style="padding: 0.75rem; background-color: rgba(75, 143, 224, 0.1); border-left: 3px solid #4B8FE0; border-radius: 4px;">
-                <strong style="color: #4B8FE0;">2. Extract</strong>
-                <p style="color: #b0b0b0; font-size: 0.85rem; margin-top: 0.25rem;">🎤 Get transcript</p>
-            </div>
-            <div style="padding: 0.75rem; background-color: rgba(15, 157, 88, 0.1); border-left: 3px solid #0F9D58; border-radius: 4px;">
-                <strong style="color: #0F9D58;">3. Process</strong>
-                <p style="color: #b0b0b0; font-size: 0.85rem; margin-top: 0.25rem;">✍️ Generate article</p>
-            </div>
-            <div style="padding: 0.75rem; background-color: rgba(240, 140, 33, 0.1); border-left: 3px solid #F08C21; border-radius: 4px;">
-                <strong style="color: #F08C21;">4. Optimize</strong>
-                <p style="color: #b0b0b0; font-size: 0.85rem; margin-top: 0.25rem;">🚀 SEO & export</p>
-            </div>
+            {hero_steps}
         </div>
     </div>
     """, unsafe_allow_html=True)
@@ -695,55 +921,51 @@ def stage0_input():
 
     with col2:
         st.markdown("<div style='height: 2.5rem; display: flex; align-items: center;'><label style='color: #c8c8c8;'>⚙️</label></div>", unsafe_allow_html=True)
-        force_whisper = st.checkbox("Force Whisper", help="Skip YouTube captions and use Whisper transcription", value=False)
-        st.session_state.force_whisper = force_whisper
+        st.checkbox("Force Whisper", key="force_whisper", help="Skip YouTube captions and use Whisper transcription")
 
 
+@st.fragment
 def stage1_transcribe():
     """Stage 1: Transcription"""
     st.title("🎤 Stage 1: Transcription")
     show_progress()
 
-    if st.session_state.transcript is None:
-        # Create status containers
-        status_container = st.empty()
-        progress_container = st.empty()
-        preview_container = st.empty()
+    if get_transcript() is None:
+        # One status block collects the progress messages for this stage
+        status = st.status("Transcribing...", expanded=True)
 
         try:
-            # Initialize pipeline if not already done
-            if st.session_state.pipeline is None:
-                status_container.info("🔧 Initializing pipeline...")
-                st.session_state.pipeline = create_pipeline()
-                status_container.success("✓ Pipeline ready")
-
-            # Show what's happening
-            status_container.info("🎥 Fetching video metadata...")
-
-            # Run transcription
-            transcript = st.session_state.pipeline.stage1_transcribe(
-                st.session_state.youtube_url,
-                force_whisper=st.session_state.get('force_whisper', False)
-            )
-
-            # Show success with actual data
-            status_container.success(f"✓ Transcription complete: {len(transcript.segments)} segments extracted!")
+            # Start transcription in the background on the first visit
+            future = st.session_state.transcribe_future
+            if future is None:
+                status.write("🔧 Initializing pipeline...")
+                get_pipeline()
+                status.write("✓ Pipeline ready")
+
+                future = get_executor().submit(
+                    _cached_transcribe,
+                    st.session_state.youtube_url,
+                    st.session_state.get('force_whisper', False)
+                )
+                st.session_state.transcribe_future = future
 
-            # Show preview of first segments
-            with preview_container.container():
-                st.subheader("📝 First Segments Preview:")
-                for i, segment in enumerate(transcript.segments[:3]):
-                    st.markdown(f"**[{segment.start:.1f}s]** {segment.text[:100]}...")
-                st.info(f"... and {len(transcript.segments) - 3} more segments")
+            # Poll until the download and transcription finish
+            if not future.done():
+                status.write("🎥 Fetching video and transcribing...")
+                time.sleep(0.5)
+                st.rerun()
 
-            st.session_state.transcript = transcript
+            st.session_state.transcribe_future = None
+            transcript = future.result()
+            status.update(label="✓ Transcription complete", state="complete")
 
-            import time
-            time.sleep(1)  # Let user see the preview
+            # The review screen on the next rerun shows the segments
+            set_transcript(transcript)
+            _prefetch_filter()
             st.rerun()
 
         except Exception as e:
-            status_container.error(f"❌ Transcription failed: {e}")
+            status.update(label=f"❌ Transcription failed: {e}", state="error")
             logger.error(f"Transcription error: {e}", exc_info=True)
             if st.button("← Back"):
                 reset_workflow()
@@ -751,18 +973,26 @@ def stage1_transcribe():
             return
 
     # Show transcript
-    transcript = st.session_state.transcript
+    transcript = get_transcript()
 
     st.success(f"✅ Transcript extracted successfully!")
 
-    # Video info
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Video Title", transcript.title)
-    with col2:
-        st.metric("Channel", transcript.channel)
-    with col3:
-        st.metric("Duration", f"{transcript.duration_seconds}s")
+    # Video info - one grid element instead of three metric columns
+    info_cards = "".join(
+        f"""<div class="metric-card">
+            <div style="color: #c8c8c8; font-size: 0.85rem; margin-bottom: 0.5rem;">{label}</div>
+            <div style="color: white; font-size: 1.5rem; font-weight: 600; overflow-wrap: anywhere;">{html.escape(value)}</div>
+        </div>"""
+        for label, value in (
+            ("Video Title", transcript.title),
+            ("Channel", transcript.channel),
+            ("Duration", f"{transcript.duration_seconds}s"),
+        )
+    )
+    st.markdown(
+        f'<div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 1rem;">{info_cards}</div>',
+        unsafe_allow_html=True
+    )
 
     st.markdown("---")
 
@@ -770,43 +1000,52 @@ def stage1_transcribe():
     st.subheader("📄 Transcript")
     st.info(f"**Source:** {transcript.source} | **Language:** {transcript.language} | **Segments:** {len(transcript.segments)}")
 
-    # Show full transcript in expandable text area
-    st.text_area(
-        "Full Transcript",
-        transcript.transcript,
-        height=300,
-        help="Review the transcript before continuing"
-    )
-
-    # Show segments
-    with st.expander(f"🔍 View {len(transcript.segments)} Segments"):
-        for i, segment in enumerate(transcript.segments[:10]):  # Show first 10
-            st.markdown(f"**[{segment.start:.1f}s - {segment.end:.1f}s]** {segment.text}")
-        if len(transcript.segments) > 10:
-            st.info(f"... and {len(transcript.segments) - 10} more segments")
-
-    st.markdown("---")
-
-    # Edit Transcript
-    with st.expander("✏️ Edit Transcript"):
-        st.markdown("**Customize the transcript before continuing:**")
-
+    # Only the editor holds the whole transcript; review shows a bounded excerpt
+    editing = st.session_state.editing_transcript
+    if editing:
         edited_transcript = st.text_area(
-            "Edit Full Transcript",
+            "Full Transcript",
             transcript.transcript,
             height=300,
-            key="edit_transcript_text"
+            help="Review the transcript before continuing"
         )
-
+    else:
+        text = transcript.transcript
+        st.code(text[:_TRANSCRIPT_PREVIEW_CHARS] + ("…" if len(text) > _TRANSCRIPT_PREVIEW_CHARS else ""), language=None)
+        if len(text) > _TRANSCRIPT_PREVIEW_CHARS:
+            with st.expander("📜 Show full transcript"):
+                if st.button("Load transcript", key="load_full_transcript"):
+                    st.session_state.show_full_transcript = True
+                if st.session_state.show_full_transcript:
+                    st.code(text, language=None, wrap_lines=True)
+
+    if not editing:
+        if st.button("✏️ Edit Transcript"):
+            st.session_state.editing_transcript = True
+            st.rerun()
+    elif st.button("💾 Save Transcript Changes"):
+        # Update the transcript in session state
         if edited_transcript != transcript.transcript:
-            if st.button("💾 Save Transcript Changes"):
-                # Update the transcript in session state
-                st.session_state.transcript.transcript = edited_transcript
-                st.success("✓ Transcript updated!")
-                st.info("The edited transcript will be used for analysis in the next stage.")
-                import time
-                time.sleep(1)
-                st.rerun()
+            set_transcript(transcript.model_copy(update={"transcript": edited_transcript}))
+            _prefetch_filter()
+        st.session_state.editing_transcript = False
+        st.rerun()
+
+    # Show segments
+    with st.expander(f"🔍 View {len(transcript.segments)} Segments"):
+        # First 10 segments as one table, rows built once in set_transcript
+        st.dataframe(
+            st.session_state.segments_preview,
+            column_order=("start", "end", "text"),
+            column_config={
+                "start": st.column_config.NumberColumn("Start", format="%.1fs"),
+                "end": st.column_config.NumberColumn("End", format="%.1fs"),
+                "text": st.column_config.TextColumn("Text", width="large"),
+            },
+            hide_index=True
+        )
+        if len(transcript.segments) > 10:
+            st.info(f"... and {len(transcript.segments) - 10} more segments")
 
     st.markdown("---")
 
@@ -824,6 +1063,23 @@ def stage1_transcribe():
             st.rerun()
 
 
+def _flags_html(flags, icon: str, show_position: bool = True) -> str:
+    """Render content-filter flags as <details> blocks in one HTML string."""
+    blocks = []
+    for flag in flags:
+        position = f"<p><b>Position:</b> {html.escape(flag.position or 'N/A')}</p>" if show_position else ""
+        blocks.append(
+            f'<details class="flag-details">'
+            f"<summary>{icon} {html.escape(flag.category.upper())}: {html.escape(flag.message)}</summary>"
+            f"<p><b>Text:</b> <i>{html.escape(flag.text)}</i></p>"
+            f"{position}"
+            f"<p><b>Confidence:</b> {flag.confidence:.0%}</p>"
+            f"</details>"
+        )
+    return "".join(blocks)
+
+
+@st.fragment
 def stage2_filter():
     """Stage 2: Content Filtering & Policy Compliance"""
     st.title("🔒 Stage 2: Content Filtering & Policy Compliance")
@@ -832,20 +1088,21 @@ def stage2_filter():
     if st.session_state.content_filter is None:
         # Create status containers
         status_container = st.empty()
-        results_container = st.empty()
 
         try:
             status_container.info("🔍 Running content policy checks...")
 
-            # Run content filtering
-            content_filter = st.session_state.pipeline.stage1_5_filter(st.session_state.transcript)
+            # Run content filtering, reusing the run started after
+            # transcription if the transcript has not changed since
+            key = st.session_state.transcript_key
+            prefetched = st.session_state.filter_future
+            st.session_state.filter_future = None
+            if prefetched is not None and prefetched[0] == key:
+                content_filter = prefetched[1].result()
+            else:
+                content_filter = _cached_filter(key, get_transcript())
 
-            # Show success
-            status_container.success(f"✓ Content filtering complete!")
             st.session_state.content_filter = content_filter
-
-            import time
-            time.sleep(1)
             st.rerun()
 
         except Exception as e:
@@ -853,7 +1110,6 @@ def stage2_filter():
             logger.error(f"Content filtering error: {e}", exc_info=True)
             if st.button("← Back"):
                 st.session_state.stage = 1
-                st.session_state.transcript = None
                 st.rerun()
             return
 
@@ -869,9 +1125,9 @@ def stage2_filter():
     }
     color = compliance_colors.get(content_filter.overall_compliance, "#909090")
 
-    col1, col2 = st.columns([2, 3], gap="medium")
-    with col1:
-        st.markdown(f"""
+    # Policy card and metric cards laid out as one CSS grid element
+    st.markdown(f"""
+    <div style="display: grid; grid-template-columns: 2fr 3fr; gap: 1rem; margin-bottom: 1rem;">
         <div style="
             background: linear-gradient(135deg, {color} 0%, {color}dd 100%);
             padding: 1.5rem;
@@ -883,39 +1139,15 @@ def stage2_filter():
             <h3 style="color: white; margin: 0 0 0.5rem 0;">Policy Check</h3>
             <h1 style="color: white; margin: 0.5rem 0 0 0; font-size: 2rem;">{content_filter.overall_compliance.upper()}</h1>
         </div>
-        """, unsafe_allow_html=True)
-
-    with col2:
-        st.markdown("<h4 style='margin-top: 0;'>📊 Content Metrics</h4>", unsafe_allow_html=True)
-
-        metric_col1, metric_col2 = st.columns(2, gap="small")
-        with metric_col1:
-            st.markdown(f"""
-            <div style="
-                background-color: #252525;
-                border: 1px solid #303030;
-                border-radius: 8px;
-                padding: 1rem;
-                text-align: center;
-            ">
-                <div style="color: #c8c8c8; font-size: 0.85rem; margin-bottom: 0.5rem;">Promotional</div>
-                <div style="color: #FF0000; font-size: 1.5rem; font-weight: 700;">{content_filter.promotional_score:.0%}</div>
-            </div>
-            """, unsafe_allow_html=True)
-
-        with metric_col2:
-            st.markdown(f"""
-            <div style="
-                background-color: #252525;
-                border: 1px solid #303030;
-                border-radius: 8px;
-                padding: 1rem;
-                text-align: center;
-            ">
-                <div style="color: #c8c8c8; font-size: 0.85rem; margin-bottom: 0.5rem;">Flags</div>
-                <div style="color: #4B8FE0; font-size: 1.5rem; font-weight: 700;">{len(content_filter.flags)}</div>
+        <div>
+            <h4 style="margin-top: 0;">📊 Content Metrics</h4>
+            <div style="display: grid; grid-template-columns: 1fr 1fr; gap: 0.5rem;">
+                {_METRIC_CARD.format(label="Promotional", color="#FF0000", value=f"{content_filter.promotional_score:.0%}")}
+                {_METRIC_CARD.format(label="Flags", color="#4B8FE0", value=len(content_filter.flags))}
             </div>
-            """, unsafe_allow_html=True)
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
 
     # Summary
     st.subheader("📋 Filtering Summary")
@@ -939,39 +1171,25 @@ def stage2_filter():
         st.subheader("🚩 Detected Issues")
 
         # Group by severity
-        by_severity = {}
+        by_severity = defaultdict(list)
         for flag in content_filter.flags:
-            if flag.severity not in by_severity:
-                by_severity[flag.severity] = []
             by_severity[flag.severity].append(flag)
 
         # Critical issues
         if "critical" in by_severity:
             st.markdown("#### 🔴 Critical Issues")
-            for flag in by_severity["critical"]:
-                with st.expander(f"⚠️ {flag.category.upper()}: {flag.message}"):
-                    st.markdown(f"**Text:** *{flag.text}*")
-                    st.markdown(f"**Position:** {flag.position or 'N/A'}")
-                    st.markdown(f"**Confidence:** {flag.confidence:.0%}")
+            st.markdown(_flags_html(by_severity["critical"], "⚠️"), unsafe_allow_html=True)
 
         # High issues
         if "high" in by_severity:
             st.markdown("#### 🟠 High Priority Issues")
-            for flag in by_severity["high"]:
-                with st.expander(f"⚠️ {flag.category.upper()}: {flag.message}"):
-                    st.markdown(f"**Text:** *{flag.text}*")
-                    st.markdown(f"**Position:** {flag.position or 'N/A'}")
-                    st.markdown(f"**Confidence:** {flag.confidence:.0%}")
+            st.markdown(_flags_html(by_severity["high"], "⚠️"), unsafe_allow_html=True)
 
         # Medium and low
         if "medium" in by_severity or "low" in by_severity:
             st.markdown("#### ℹ️ Other Items")
-            for severity in ["medium", "low"]:
-                if severity in by_severity:
-                    for flag in by_severity[severity]:
-                        with st.expander(f"ℹ️ {flag.category.upper()}: {flag.message}"):
-                            st.markdown(f"**Text:** *{flag.text}*")
-                            st.markdown(f"**Confidence:** {flag.confidence:.0%}")
+            other_flags = by_severity.get("medium", []) + by_severity.get("low", [])
+            st.markdown(_flags_html(other_flags, "ℹ️", show_position=False), unsafe_allow_html=True)
 
     if content_filter.quality_issues:
         st.markdown("---")
@@ -987,8 +1205,6 @@ def stage2_filter():
     with col1:
         if st.button("← Back"):
             st.session_state.stage = 1
-            st.session_state.transcript = None
-            st.session_state.content_filter = None
             st.rerun()
 
     # Proceed button based on compliance
@@ -1009,55 +1225,9 @@ def stage2_filter():
                         st.rerun()
 
 
-def stage3_analyze():
-    """Stage 3: Content Analysis"""
-    st.title("🔍 Stage 3: Content Analysis")
-    show_progress()
-    st.markdown("---")
-
-    if st.session_state.analysis is None:
-        # Create status containers
-        status_container = st.empty()
-        preview_container = st.empty()
-
-        try:
-            status_container.info("🤖 AI is analyzing content structure... (using Llama 3.3 70B)")
-
-            # Run analysis
-            analysis = st.session_state.pipeline.stage2_analyze(st.session_state.transcript)
-
-            # Show success with snippets
-            status_container.success(f"✓ Analysis complete: {len(analysis.subtopics)} topics, {len(analysis.suggested_sections)} sections identified!")
-
-            # Show preview
-            with preview_container.container():
-                st.subheader("🎯 AI Detected:")
-                st.markdown(f"**Main Topic:** {analysis.main_topic}")
-                st.markdown(f"**Key Subtopics:**")
-                for subtopic in analysis.subtopics[:3]:
-                    st.markdown(f"- {subtopic}")
-                if len(analysis.subtopics) > 3:
-                    st.info(f"... and {len(analysis.subtopics) - 3} more")
-
-            st.session_state.analysis = analysis
-
-            import time
-            time.sleep(1.5)  # Let user see the preview
-            st.rerun()
-
-        except Exception as e:
-            status_container.error(f"❌ Analysis failed: {e}")
-            logger.error(f"Analysis error: {e}", exc_info=True)
-            if st.button("← Back"):
-                st.session_state.stage = 2
-                st.rerun()
-            return
-
-    # Show analysis
-    analysis = st.session_state.analysis
-
-    st.success("✅ Content analysis complete!")
-
+@st.fragment
+def _analysis_preview(analysis):
+    """Read-only view of the generated analysis."""
     # Key metrics
     col1, col2 = st.columns(2)
     with col1:
@@ -1073,8 +1243,7 @@ def stage3_analyze():
 
     # Subtopics
     st.subheader("🎯 Key Subtopics")
-    for i, subtopic in enumerate(analysis.subtopics, 1):
-        st.markdown(f"{i}. {subtopic}")
+    st.markdown("\n".join(f"{i}. {subtopic}" for i, subtopic in enumerate(analysis.subtopics, 1)))
 
     # Suggested sections
     st.subheader("📑 Suggested Article Structure")
@@ -1090,80 +1259,84 @@ def stage3_analyze():
             for quote in analysis.key_quotes:
                 st.markdown(f"> \"{quote.text}\" *[{quote.timestamp}s]*")
 
-    st.markdown("---")
 
-    # Edit Analysis
+@st.fragment
+def _analysis_editor(analysis):
+    """Edit form for the analysis, applied when Save is submitted."""
     with st.expander("✏️ Edit Analysis"):
-        st.markdown("**Customize the content analysis:**")
+        # A form holds the edits client-side until Save, so typing never reruns
+        with st.form("edit_analysis_form", border=False):
+            st.markdown("**Customize the content analysis:**")
 
-        col1, col2 = st.columns([1, 1])
+            col1, col2 = st.columns([1, 1])
 
-        # Edit main topic
-        with col1:
-            st.markdown("##### Main Topic")
-            edited_main_topic = st.text_area(
-                "Edit main topic",
-                analysis.main_topic,
-                height=80,
-                key="edit_main_topic"
-            )
-            if edited_main_topic != analysis.main_topic:
-                st.session_state.analysis.main_topic = edited_main_topic
-
-        # Edit subtopics
-        with col2:
-            st.markdown("##### Key Subtopics")
-            subtopics_text = "\n".join(analysis.subtopics)
-            edited_subtopics_text = st.text_area(
-                "Edit subtopics (one per line)",
-                subtopics_text,
-                height=80,
-                key="edit_subtopics"
-            )
-            if edited_subtopics_text != subtopics_text:
-                edited_subtopics = [s.strip() for s in edited_subtopics_text.split("\n") if s.strip()]
-                st.session_state.analysis.subtopics = edited_subtopics
-
-        # Edit suggested sections
-        st.markdown("##### Suggested Article Sections")
-        for i, section in enumerate(analysis.suggested_sections):
-            col1, col2 = st.columns([2, 1])
-            with col1:
-                edited_title = st.text_input(
-                    f"Section {i+1} title",
-                    section.title,
-                    key=f"edit_section_title_{i}"
-                )
-                if edited_title != section.title:
-                    st.session_state.analysis.suggested_sections[i].title = edited_title
+            # Edit main topic
+            with col1:
+                st.markdown("##### Main Topic")
+                st.text_area(
+                    "Edit main topic",
+                    analysis.main_topic,
+                    height=80,
+                    key="edit_main_topic"
+                )
 
+            # Edit subtopics
             with col2:
-                edited_desc = st.text_area(
-                    f"Section {i+1} description",
-                    section.description,
-                    height=60,
-                    key=f"edit_section_desc_{i}"
+                st.markdown("##### Key Subtopics")
+                st.text_area(
+                    "Edit subtopics (one per line)",
+                    "\n".join(analysis.subtopics),
+                    height=80,
+                    key="edit_subtopics"
                 )
-                if edited_desc != section.description:
-                    st.session_state.analysis.suggested_sections[i].description = edited_desc
-
-        # Save changes
-        if st.button("💾 Save Analysis Changes"):
-            st.success("✓ Analysis updated!")
-            st.info("The edited analysis will be used for article generation in the next stage.")
-            import time
-            time.sleep(1)
-            st.rerun()
 
-    st.markdown("---")
+            # Edit suggested sections
+            # One table widget for all rows; timestamps ride along hidden
+            st.markdown("##### Suggested Article Sections")
+            edited_sections = st.data_editor(
+                [section.model_dump() for section in analysis.suggested_sections],
+                column_order=("title", "description"),
+                column_config={
+                    "title": st.column_config.TextColumn("Title", required=True),
+                    "description": st.column_config.TextColumn("Description", width="large"),
+                },
+                num_rows="dynamic",
+                key="edit_analysis_sections"
+            )
 
-    # Actions
+            # Save changes - edits are read back from the widget keys only here
+            if st.form_submit_button("💾 Save Analysis Changes"):
+                # Build the edited analysis from the widget values in one go
+                st.session_state.analysis = analysis.model_copy(update={
+                    "main_topic": st.session_state["edit_main_topic"],
+                    "subtopics": [s.strip() for s in st.session_state["edit_subtopics"].split("\n") if s.strip()],
+                    "suggested_sections": [
+                        SectionOutline(
+                            title=row["title"],
+                            description=row["description"] or "",
+                            start_time=row.get("start_time"),
+                            end_time=row.get("end_time")
+                        )
+                        for row in edited_sections
+                        if row["title"]
+                    ]
+                })
+
+                clear_downstream("analysis")
+
+                # A toast outlives the rerun, so the confirmation needs no pause
+                st.toast("✓ Analysis updated! The edited analysis will be used for article generation in the next stage.", icon="✅")
+                st.rerun()
+
+
+@st.fragment
+def _analysis_actions():
+    """Back / approve navigation buttons."""
     col1, col2 = st.columns([1, 1])
 
     with col1:
         if st.button("← Back"):
             st.session_state.stage = 2
-            st.session_state.analysis = None
             st.rerun()
 
     with col2:
@@ -1172,6 +1345,50 @@ def stage3_analyze():
             st.rerun()
 
 
+@st.fragment
+def stage3_analyze():
+    """Stage 3: Content Analysis"""
+    st.title("🔍 Stage 3: Content Analysis")
+    show_progress()
+    st.markdown("---")
+
+    if st.session_state.analysis is None:
+        # One status block for the whole stage, updated in place when done
+        status = st.status("🤖 AI is analyzing content structure... (using Llama 3.3 70B)", expanded=True)
+
+        try:
+
+            # Run analysis
+            analysis = _cached_analyze(st.session_state.transcript_key, get_transcript())
+
+            # Render the results below on this same run
+            status.update(label=f"✓ Analysis complete: {len(analysis.subtopics)} topics, {len(analysis.suggested_sections)} sections identified!", state="complete", expanded=False)
+            st.session_state.analysis = analysis
+
+        except Exception as e:
+            status.update(label=f"❌ Analysis failed: {e}", state="error")
+            logger.error(f"Analysis error: {e}", exc_info=True)
+            if st.button("← Back"):
+                st.session_state.stage = 2
+                st.rerun()
+            return
+
+    # Show analysis
+    analysis = st.session_state.analysis
+
+    st.success("✅ Content analysis complete!")
+
+    _analysis_preview(analysis)
+
+    st.markdown("---")
+
+    _analysis_editor(analysis)
+
+    st.markdown("---")
+
+    _analysis_actions()
+
+@st.fragment
 def stage4_select_theme():
     """Stage 4: Article Theme Selection"""
     st.title("🎨 Stage 4: Select Article Theme")
@@ -1192,6 +1409,14 @@ def stage4_select_theme():
     st.subheader("🎨 Customize Your Article Theme")
     st.markdown("Choose how your article should be written:")
 
+    # Coming back to this stage, start the widgets from the theme chosen
+    # before, so Back and forward again keeps the article written for it
+    if st.session_state.theme is not None:
+        for field, value in st.session_state.theme.model_dump().items():
+            st.session_state.setdefault(field, value)
+    st.session_state.setdefault("use_examples", True)
+    st.session_state.setdefault("include_quotes", True)
+
     col1, col2 = st.columns(2)
 
     with col1:
@@ -1259,8 +1484,8 @@ def stage4_select_theme():
         )
 
         st.markdown("#### ✨ Additional Options")
-        use_examples = st.checkbox("Include practical examples & case studies", value=True, key="use_examples")
-        include_quotes = st.checkbox("Include quotes from the video", value=True, key="include_quotes")
+        use_examples = st.checkbox("Include practical examples & case studies", key="use_examples")
+        include_quotes = st.checkbox("Include quotes from the video", key="include_quotes")
 
     st.markdown("---")
 
@@ -1278,13 +1503,12 @@ def stage4_select_theme():
 
     with col1:
         if st.button("← Back"):
-            st.session_state.stage = 2
+            st.session_state.stage = 3
             st.rerun()
 
     with col2:
         if st.button("✓ Generate Article with Theme →", type="primary"):
             # Create ArticleTheme object
-            from models.schemas import ArticleTheme
             theme = ArticleTheme(
                 theme_style=st.session_state.theme_style,
                 target_audience=st.session_state.target_audience,
@@ -1295,65 +1519,17 @@ def stage4_select_theme():
                 include_quotes=st.session_state.include_quotes,
                 custom_focus=st.session_state.custom_focus if st.session_state.custom_focus else None
             )
+            # An unchanged theme keeps the article already written for it
+            if theme != st.session_state.theme:
+                clear_downstream("theme")
             st.session_state.theme = theme
-            st.session_state.stage = 4
-            st.rerun()
-
-
-def stage5_write():
-    """Stage 5: Article Generation"""
-    st.title("✍️ Stage 5: Article Generation")
-    show_progress()
-    st.markdown("---")
-
-    if st.session_state.article is None:
-        # Create status containers
-        status_container = st.empty()
-        progress_bar = st.empty()
-        preview_container = st.empty()
-
-        try:
-            status_container.info("✍️ AI is writing your article... (using Llama 3.3 70B)")
-            progress_bar.progress(0.3, text="Crafting headline and introduction...")
-
-            # Run article generation
-            article = st.session_state.pipeline.stage4_write(
-                st.session_state.transcript,
-                st.session_state.analysis,
-                st.session_state.theme
-            )
-
-            progress_bar.progress(1.0, text="Article complete!")
-
-            # Show success with snippets
-            status_container.success(f"✓ Article generated: {article.word_count} words, {len(article.sections)} sections!")
-
-            # Show preview
-            with preview_container.container():
-                st.subheader("📰 Article Preview:")
-                st.markdown(f"# {article.headline}")
-                st.markdown(article.introduction[:200] + "...")
-                st.info(f"✓ {len(article.sections)} sections written")
-
-            st.session_state.article = article
-
-            import time
-            time.sleep(1.5)  # Let user see the preview
+            st.session_state.stage = 5
             st.rerun()
 
-        except Exception as e:
-            status_container.error(f"❌ Article generation failed: {e}")
-            logger.error(f"Article generation error: {e}", exc_info=True)
-            if st.button("← Back"):
-                st.session_state.stage = 3
-                st.rerun()
-            return
-
-    # Show article
-    article = st.session_state.article
-
-    st.success("✅ Article generated successfully!")
 
+@st.fragment
+def _article_preview(article):
+    """Read-only view of the generated article."""
     # Metrics
     col1, col2, col3 = st.columns(3)
     with col1:
@@ -1361,187 +1537,189 @@ def stage5_write():
     with col2:
         st.metric("Sections", len(article.sections))
     with col3:
-        reading_time = article.word_count // 200
-        st.metric("Reading Time", f"{reading_time} min")
+        st.metric("Reading Time", f"{article.word_count // 200} min")
 
     st.markdown("---")
 
     # Article preview
     st.subheader("📰 Article Preview")
 
-    # Headline
-    st.markdown(f"# {article.headline}")
-
-    # Introduction
-    st.markdown(article.introduction)
-
-    # Sections
-    for section in article.sections:
-        st.markdown(f"## {section.heading}")
-        st.markdown(section.content)
-
-    # Conclusion
-    if article.conclusion:
-        st.markdown("## Conclusion")
-        st.markdown(article.conclusion)
+    # The stored markdown is the whole article (kept in sync by
+    # rebuild_markdown on edits), so render it as one element
+    st.markdown(article.markdown)
 
     st.markdown("---")
 
     # Full markdown
+    # Highlighting a long article is slow, so only render it on request
     with st.expander("📝 View Full Markdown"):
-        st.code(article.markdown, language="markdown")
+        st.download_button(
+            label="📄 Download .md",
+            data=lambda: article.markdown,
+            file_name="article.md",
+            mime="text/markdown",
+            key="download_draft_md"
+        )
+        if st.button("Load markdown", key="load_full_md"):
+            st.session_state.show_full_md = True
+        if st.session_state.show_full_md:
+            st.code(article.markdown, language="markdown")
 
-    st.markdown("---")
 
-    # Edit Article
+@st.fragment
+def _article_editor(article):
+    """Edit form for the article, applied when Save is submitted."""
     with st.expander("✏️ Edit Article Content"):
-        st.markdown("**Customize your article:**")
-
-        # Edit headline
-        st.markdown("##### Headline")
-        edited_headline = st.text_input(
-            "Edit headline",
-            article.headline,
-            key="edit_headline"
-        )
-        if edited_headline != article.headline:
-            st.session_state.article.headline = edited_headline
-
-        # Edit introduction
-        st.markdown("##### Introduction")
-        edited_intro = st.text_area(
-            "Edit introduction",
-            article.introduction,
-            height=120,
-            key="edit_introduction"
-        )
-        if edited_intro != article.introduction:
-            st.session_state.article.introduction = edited_intro
-
-        # Edit sections
-        st.markdown("##### Article Sections")
-        for i, section in enumerate(article.sections):
-            st.markdown(f"**Section {i+1}: {section.heading}**")
-            edited_heading = st.text_input(
-                f"Section {i+1} heading",
-                section.heading,
-                key=f"edit_heading_{i}"
-            )
-            if edited_heading != section.heading:
-                st.session_state.article.sections[i].heading = edited_heading
-
-            edited_content = st.text_area(
-                f"Section {i+1} content",
-                section.content,
-                height=150,
-                key=f"edit_content_{i}"
+        # A form holds the edits client-side until Save, so typing never reruns
+        with st.form("edit_article_form", border=False):
+            st.markdown("**Customize your article:**")
+
+            # Edit headline
+            st.markdown("##### Headline")
+            st.text_input(
+                "Edit headline",
+                article.headline,
+                key="edit_headline"
             )
-            if edited_content != section.content:
-                st.session_state.article.sections[i].content = edited_content
-
-        # Edit conclusion
-        if article.conclusion:
-            st.markdown("##### Conclusion")
-            edited_conclusion = st.text_area(
-                "Edit conclusion",
-                article.conclusion,
+
+            # Edit introduction
+            st.markdown("##### Introduction")
+            st.text_area(
+                "Edit introduction",
+                article.introduction,
                 height=120,
-                key="edit_conclusion"
+                key="edit_introduction"
             )
-            if edited_conclusion != article.conclusion:
-                st.session_state.article.conclusion = edited_conclusion
-
-        # Save changes
-        if st.button("💾 Save Article Changes"):
-            # Recalculate word count from updated sections
-            from models.schemas import Article
-            new_markdown = f"# {st.session_state.article.headline}\n\n"
-            new_markdown += st.session_state.article.introduction + "\n\n"
-            for section in st.session_state.article.sections:
-                new_markdown += f"## {section.heading}\n\n{section.content}\n\n"
-            if st.session_state.article.conclusion:
-                new_markdown += f"## Conclusion\n\n{st.session_state.article.conclusion}\n\n"
-
-            word_count = len(new_markdown.split())
-            st.session_state.article.markdown = new_markdown
-            st.session_state.article.word_count = word_count
-
-            st.success("✓ Article updated!")
-            st.info("The edited article will be used for SEO optimization in the next stage.")
-            import time
-            time.sleep(1)
-            st.rerun()
 
-    st.markdown("---")
+            # Edit sections
+            st.markdown("##### Article Sections")
+            edited_sections = st.data_editor(
+                [{"heading": section.heading, "content": section.content} for section in article.sections],
+                column_config={
+                    "heading": st.column_config.TextColumn("Heading", required=True),
+                    "content": st.column_config.TextColumn("Content", width="large"),
+                },
+                num_rows="dynamic",
+                key="edit_article_sections"
+            )
 
-    # Actions
-    col1, col2 = st.columns([1, 1])
+            # Edit conclusion
+            if article.conclusion:
+                st.markdown("##### Conclusion")
+                st.text_area(
+                    "Edit conclusion",
+                    article.conclusion,
+                    height=120,
+                    key="edit_conclusion"
+                )
+
+            # Save changes
+            if st.form_submit_button("💾 Save Article Changes"):
+                # Only recount sections whose text actually changed
+                word_counts = {section.content: section.word_count for section in article.sections}
+                sections = []
+                for row in edited_sections:
+                    if not row["heading"]:
+                        continue
+                    content = row["content"] or ""
+                    word_count = word_counts.get(content)
+                    if word_count is None:
+                        word_count = len(content.split())
+                    sections.append(ArticleSection(heading=row["heading"], content=content, word_count=word_count))
+                # Build the edited article from the widget values in one go
+                updated = article.model_copy(update={
+                    "headline": st.session_state["edit_headline"],
+                    "introduction": st.session_state["edit_introduction"],
+                    "sections": sections,
+                    "conclusion": st.session_state["edit_conclusion"] if article.conclusion else article.conclusion
+                })
+                updated.rebuild_markdown()
+                st.session_state.article = updated
+                clear_downstream("article")
+
+                st.toast("✓ Article updated! The edited article will be used for SEO optimization in the next stage.", icon="✅")
+                st.rerun()
+
+
+@st.fragment
+def _article_actions():
+    """Back / regenerate / approve navigation buttons."""
+    col1, col2, col3 = st.columns(3)
 
     with col1:
         if st.button("← Back"):
-            st.session_state.stage = 3
-            st.session_state.article = None
+            st.session_state.stage = 4
             st.rerun()
 
     with col2:
+        if st.button("🔄 Regenerate", help="Write a fresh article instead of reusing the cached one"):
+            clear_downstream("theme")
+            st.session_state.regenerate_article = True
+            st.rerun()
+
+    with col3:
         if st.button("✓ Approve & Add SEO →", type="primary"):
-            st.session_state.stage = 5
+            st.session_state.stage = 6
             st.rerun()
 
 
-def stage6_seo():
-    """Stage 6: SEO Optimization"""
-    st.title("🚀 Stage 6: SEO Optimization")
+@st.fragment
+def stage5_write():
+    """Stage 5: Article Generation"""
+    st.title("✍️ Stage 5: Article Generation")
     show_progress()
     st.markdown("---")
 
-    if st.session_state.seo is None:
-        # Create status containers
-        status_container = st.empty()
-        preview_container = st.empty()
+    if st.session_state.article is None:
+        # One status block for the whole stage, updated in place when done
+        status = st.status("✍️ AI is writing your article... (using Llama 3.3 70B)", expanded=True)
 
         try:
-            status_container.info("🚀 AI is optimizing for SEO... (using Llama 3.1 8B)")
-
-            # Run SEO generation
-            seo = st.session_state.pipeline.stage4_optimize_seo(
-                st.session_state.article,
+            # Run article generation, showing sections as they are written
+            stream = get_pipeline().stage4_write_stream(
+                get_transcript(),
                 st.session_state.analysis,
-                st.session_state.transcript
+                st.session_state.theme,
+                use_cache=not st.session_state.regenerate_article
             )
+            result = []
+            with status, _hf_slots():
+                st.write_stream(_section_markdown(stream, result))
+            article = result[0]
 
-            # Show success with snippets
-            status_container.success(f"✓ SEO package complete: {len(seo.secondary_keywords) + 1} keywords, meta tags, social posts!")
-
-            # Show preview
-            with preview_container.container():
-                st.subheader("🔑 SEO Preview:")
-                st.markdown(f"**Meta Title:** {seo.meta_title}")
-                st.markdown(f"**Primary Keyword:** {seo.primary_keyword}")
-                st.markdown(f"**URL Slug:** {seo.slug}")
-                st.info(f"✓ Meta tags, Open Graph, Twitter Card, and social posts ready!")
-
-            st.session_state.seo = seo
-
-            import time
-            time.sleep(1.5)  # Let user see the preview
-            st.rerun()
+            # Render the results below on this same run
+            status.update(label=f"✓ Article generated: {article.word_count} words, {len(article.sections)} sections!", state="complete", expanded=False)
+            st.session_state.article = article
+            st.session_state.regenerate_article = False
 
         except Exception as e:
-            status_container.error(f"❌ SEO generation failed: {e}")
-            logger.error(f"SEO error: {e}", exc_info=True)
+            status.update(label=f"❌ Article generation failed: {e}", state="error")
+            logger.error(f"Article generation error: {e}", exc_info=True)
             if st.button("← Back"):
                 st.session_state.stage = 4
                 st.rerun()
             return
 
-    # Show SEO
-    seo = st.session_state.seo
+    # Show article
+    article = st.session_state.article
 
-    st.success("✅ SEO package generated!")
+    st.success("✅ Article generated successfully!")
+
+    _article_preview(article)
+
+    st.markdown("---")
+
+    _article_editor(article)
 
     st.markdown("---")
 
+    _article_actions()
+
+@st.fragment
+def _seo_preview(seo):
+    """Read-only view of the generated SEO package."""
+    st.markdown("---")
+
     # Meta tags
     st.subheader("🏷️ Meta Tags")
     col1, col2 = st.columns(2)
@@ -1564,228 +1742,174 @@ def stage6_seo():
     with col2:
         st.text_area("LinkedIn", seo.social_posts.linkedin, height=100, disabled=True)
 
-    st.markdown("---")
 
-    # Edit SEO
+@st.fragment
+def _seo_editor(seo):
+    """Edit form for the SEO package, applied when Save is submitted."""
     with st.expander("✏️ Edit SEO Package"):
-        st.markdown("**Customize your SEO optimization:**")
+        # A form holds the edits client-side until Save, so typing never reruns
+        with st.form("edit_seo_form", border=False):
+            st.markdown("**Customize your SEO optimization:**")
 
-        col1, col2 = st.columns([1, 1])
+            col1, col2 = st.columns([1, 1])
 
-        # Edit meta tags
-        with col1:
-            st.markdown("##### Meta Tags")
-            edited_meta_title = st.text_input(
-                "Edit meta title",
-                seo.meta_title,
-                max_chars=60,
-                key="edit_meta_title"
-            )
-            if edited_meta_title != seo.meta_title:
-                st.session_state.seo.meta_title = edited_meta_title
-
-            edited_meta_desc = st.text_area(
-                "Edit meta description",
-                seo.meta_description,
-                height=80,
-                key="edit_meta_desc"
-            )
-            if edited_meta_desc != seo.meta_description:
-                st.session_state.seo.meta_description = edited_meta_desc
+            # Edit meta tags
+            with col1:
+                st.markdown("##### Meta Tags")
+                st.text_input(
+                    "Edit meta title",
+                    seo.meta_title,
+                    max_chars=60,
+                    key="edit_meta_title"
+                )
 
-            edited_slug = st.text_input(
-                "Edit URL slug",
-                seo.slug,
-                key="edit_slug"
-            )
-            if edited_slug != seo.slug:
-                st.session_state.seo.slug = edited_slug
+                st.text_area(
+                    "Edit meta description",
+                    seo.meta_description,
+                    height=80,
+                    key="edit_meta_desc"
+                )
 
-        # Edit keywords
-        with col2:
-            st.markdown("##### Keywords")
-            edited_primary_keyword = st.text_input(
-                "Edit primary keyword",
-                seo.primary_keyword,
-                key="edit_primary_keyword"
-            )
-            if edited_primary_keyword != seo.primary_keyword:
-                st.session_state.seo.primary_keyword = edited_primary_keyword
-
-            secondary_keywords_text = ", ".join(seo.secondary_keywords)
-            edited_secondary_text = st.text_area(
-                "Edit secondary keywords (comma-separated)",
-                secondary_keywords_text,
-                height=80,
-                key="edit_secondary_keywords"
-            )
-            if edited_secondary_text != secondary_keywords_text:
-                edited_secondary = [k.strip() for k in edited_secondary_text.split(",") if k.strip()]
-                st.session_state.seo.secondary_keywords = edited_secondary
+                st.text_input(
+                    "Edit URL slug",
+                    seo.slug,
+                    key="edit_slug"
+                )
 
-        # Edit social posts
-        st.markdown("##### Social Media Posts")
-        col1, col2 = st.columns([1, 1])
+            # Edit keywords
+            with col2:
+                st.markdown("##### Keywords")
+                st.text_input(
+                    "Edit primary keyword",
+                    seo.primary_keyword,
+                    key="edit_primary_keyword"
+                )
 
-        with col1:
-            edited_twitter = st.text_area(
-                "Edit Twitter/X post",
-                seo.social_posts.twitter,
-                height=80,
-                key="edit_twitter_post"
-            )
-            if edited_twitter != seo.social_posts.twitter:
-                st.session_state.seo.social_posts.twitter = edited_twitter
+                st.text_area(
+                    "Edit secondary keywords (comma-separated)",
+                    ", ".join(seo.secondary_keywords),
+                    height=80,
+                    key="edit_secondary_keywords"
+                )
 
-        with col2:
-            edited_linkedin = st.text_area(
-                "Edit LinkedIn post",
-                seo.social_posts.linkedin,
-                height=80,
-                key="edit_linkedin_post"
-            )
-            if edited_linkedin != seo.social_posts.linkedin:
-                st.session_state.seo.social_posts.linkedin = edited_linkedin
-
-        # Save changes
-        if st.button("💾 Save SEO Changes"):
-            st.success("✓ SEO package updated!")
-            st.info("The edited SEO data will be included in your final output.")
-            import time
-            time.sleep(1)
-            st.rerun()
+            # Edit social posts
+            st.markdown("##### Social Media Posts")
+            col1, col2 = st.columns([1, 1])
 
-    st.markdown("---")
+            with col1:
+                st.text_area(
+                    "Edit Twitter/X post",
+                    seo.social_posts.twitter,
+                    height=80,
+                    key="edit_twitter_post"
+                )
 
-    # Actions
+            with col2:
+                st.text_area(
+                    "Edit LinkedIn post",
+                    seo.social_posts.linkedin,
+                    height=80,
+                    key="edit_linkedin_post"
+                )
+
+            # Save changes
+            if st.form_submit_button("💾 Save SEO Changes"):
+                # Build the edited SEO package from the widget values in one go
+                st.session_state.seo = seo.model_copy(update={
+                    "meta_title": st.session_state["edit_meta_title"],
+                    "meta_description": st.session_state["edit_meta_desc"],
+                    "slug": st.session_state["edit_slug"],
+                    "primary_keyword": st.session_state["edit_primary_keyword"],
+                    "secondary_keywords": [k.strip() for k in st.session_state["edit_secondary_keywords"].split(",") if k.strip()],
+                    "social_posts": seo.social_posts.model_copy(update={
+                        "twitter": st.session_state["edit_twitter_post"],
+                        "linkedin": st.session_state["edit_linkedin_post"]
+                    })
+                })
+
+                clear_downstream("seo")
+
+                st.toast("✓ SEO package updated! The edited SEO data will be included in your final output.", icon="✅")
+                st.rerun()
+
+
+@st.fragment
+def _seo_actions():
+    """Back / approve navigation buttons."""
     col1, col2 = st.columns([1, 1])
 
     with col1:
         if st.button("← Back"):
-            st.session_state.stage = 4
-            st.session_state.seo = None
+            st.session_state.stage = 5
             st.rerun()
 
     with col2:
         if st.button("✓ Assess Quality →", type="primary"):
-            st.session_state.stage = 6
+            st.session_state.stage = 7
             st.rerun()
 
 
-def stage7_quality_assessment():
-    """Stage 7: Quality Assessment"""
-    st.title("✅ Stage 7: Quality Assessment")
+@st.fragment
+def stage6_seo():
+    """Stage 6: SEO Optimization"""
+    st.title("🚀 Stage 6: SEO Optimization")
     show_progress()
     st.markdown("---")
 
-    if st.session_state.quality_assessment is None:
-        # Create status containers
-        status_container = st.empty()
-        preview_container = st.empty()
+    if st.session_state.seo is None:
+        # One status block for the whole stage, updated in place when done
+        status = st.status("🚀 AI is optimizing for SEO... (using Llama 3.1 8B)", expanded=True)
 
         try:
-            status_container.info("🔍 Analyzing article quality...")
 
-            # Run quality assessment
-            qa = st.session_state.pipeline.stage5_assess_quality(
+            # Run SEO generation
+            seo = _cached_seo(
+                st.session_state.transcript_key,
+                get_transcript(),
                 st.session_state.article,
-                st.session_state.analysis,
-                st.session_state.seo
+                st.session_state.analysis
             )
 
-            # Show success with quality rating
-            status_container.success(f"✓ Quality assessment complete: {qa.quality_rating.upper()} ({qa.overall_score:.1f}/100)")
-
-            # Show preview
-            with preview_container.container():
-                st.subheader("📊 Quality Overview:")
-                col1, col2, col3, col4 = st.columns(4)
-                with col1:
-                    st.metric("Overall Score", f"{qa.overall_score:.0f}/100")
-                with col2:
-                    st.metric("Content Quality", f"{qa.content_quality.average_score:.0f}/100")
-                with col3:
-                    st.metric("SEO Quality", f"{qa.seo_quality.average_score:.0f}/100")
-                with col4:
-                    st.metric("Structure", f"{qa.structure_check.passed_checks}/{qa.structure_check.total_checks}")
-
-            st.session_state.quality_assessment = qa
-
-            import time
-            time.sleep(1.5)  # Let user see the preview
-            st.rerun()
+            # Render the results below on this same run
+            status.update(label=f"✓ SEO package complete: {len(seo.secondary_keywords) + 1} keywords, meta tags, social posts!", state="complete", expanded=False)
+            st.session_state.seo = seo
 
         except Exception as e:
-            status_container.error(f"❌ Quality assessment failed: {e}")
-            logger.error(f"Quality assessment error: {e}", exc_info=True)
+            status.update(label=f"❌ SEO generation failed: {e}", state="error")
+            logger.error(f"SEO error: {e}", exc_info=True)
             if st.button("← Back"):
                 st.session_state.stage = 5
                 st.rerun()
             return
 
-    # Show quality assessment
-    qa = st.session_state.quality_assessment
-
-    st.success("✅ Quality assessment complete!")
-
-    st.markdown("---")
-
-    # Quality rating with color
-    rating_colors = {
-        "excellent": "#0F9D58",
-        "good": "#4285F4",
-        "fair": "#F9AB00",
-        "poor": "#EA4335"
-    }
-    rating_color = rating_colors.get(qa.quality_rating, "#909090")
+    # Show SEO
+    seo = st.session_state.seo
 
-    col1, col2 = st.columns([2, 3])
-    with col1:
-        st.markdown(f"""
-        <div style="background-color: {rating_color}; padding: 20px; border-radius: 8px; text-align: center;">
-            <h1 style="color: white; margin: 0;">{qa.overall_score:.1f}</h1>
-            <h3 style="color: white; margin: 5px 0 0 0;">Quality Score</h3>
-            <p style="color: white; font-size: 18px; margin: 10px 0 0 0; text-transform: uppercase;">{qa.quality_rating}</p>
-        </div>
-        """, unsafe_allow_html=True)
+    st.success("✅ SEO package generated!")
 
-    with col2:
-        st.markdown("#### 📊 Detailed Scores")
-        st.info(f"**Content Quality:** {qa.content_quality.average_score:.1f}/100")
-        st.info(f"**SEO Quality:** {qa.seo_quality.average_score:.1f}/100")
-        st.info(f"**Structure Check:** {qa.structure_check.passed_checks}/{qa.structure_check.total_checks} ✓")
+    _seo_preview(seo)
 
     st.markdown("---")
 
-    # Content Quality Breakdown
-    st.subheader("📝 Content Quality Breakdown")
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Readability", f"{qa.content_quality.readability_score:.0f}", help="How easy the article is to read")
-        st.metric("Coherence", f"{qa.content_quality.coherence_score:.0f}", help="How well sections flow together")
-    with col2:
-        st.metric("Completeness", f"{qa.content_quality.completeness_score:.0f}", help="Coverage of topic")
-        st.metric("Relevance", f"{qa.content_quality.relevance_score:.0f}", help="Alignment with main topic")
-    with col3:
-        st.metric("Uniqueness", f"{qa.content_quality.uniqueness_score:.0f}", help="Originality of content")
+    _seo_editor(seo)
 
     st.markdown("---")
 
-    # SEO Quality Breakdown
-    st.subheader("🔍 SEO Quality Breakdown")
-    col1, col2, col3 = st.columns(3)
-    with col1:
-        st.metric("Keyword Optimization", f"{qa.seo_quality.keyword_optimization:.0f}")
-        st.metric("Meta Tag Quality", f"{qa.seo_quality.meta_tag_quality:.0f}")
-    with col2:
-        st.metric("Slug Quality", f"{qa.seo_quality.slug_quality:.0f}")
-        st.metric("Schema Markup", f"{qa.seo_quality.schema_markup_quality:.0f}")
-    with col3:
-        st.metric("Social Media", f"{qa.seo_quality.social_media_optimization:.0f}")
+    _seo_actions()
+
+@st.cache_data(show_spinner=False)
+def _rating_card_svg(rating: str, score: float) -> str:
+    """Quality score card as SVG markup, colored by rating."""
+    return _RATING_CARD_SVG.format(
+        color=RATING_COLORS.get(rating, YOUTUBE_GRAY),
+        score=score,
+        rating=html.escape(rating.upper())
+    )
 
-    st.markdown("---")
 
-    # Structure Validation
+@st.fragment
+def _render_structure(qa):
+    """Pass/fail boxes for each StructureCheck field."""
     st.subheader("🏗️ Structure Validation")
     checks = [
         ("Headline present", qa.structure_check.has_headline),
@@ -1806,38 +1930,39 @@ def stage7_quality_assessment():
             else:
                 st.error(f"✗ {check_name}")
 
-    st.markdown("---")
 
-    # Recommendations
+@st.fragment
+def _render_recommendations(qa):
+    """Recommendations grouped by severity, one expander each."""
     if qa.recommendations:
         st.subheader("💡 Improvement Recommendations")
 
-        # Group recommendations by severity
-        critical = [r for r in qa.recommendations if r.severity == "critical"]
-        warning = [r for r in qa.recommendations if r.severity == "warning"]
-        info = [r for r in qa.recommendations if r.severity == "info"]
+        # Group recommendations by severity in one pass
+        by_severity = defaultdict(list)
+        for rec in qa.recommendations:
+            by_severity[rec.severity].append(rec)
 
-        if critical:
+        if "critical" in by_severity:
             st.markdown("#### 🔴 Critical Issues")
-            for rec in critical:
+            for rec in by_severity["critical"]:
                 with st.expander(f"⚠️ {rec.message}"):
                     st.markdown(f"**Category:** {rec.category}")
                     st.markdown(f"**Issue:** {rec.message}")
                     if rec.action:
                         st.markdown(f"**Recommended Action:** {rec.action}")
 
-        if warning:
+        if "warning" in by_severity:
             st.markdown("#### 🟡 Warnings")
-            for rec in warning:
+            for rec in by_severity["warning"]:
                 with st.expander(f"⚠️ {rec.message}"):
                     st.markdown(f"**Category:** {rec.category}")
                     st.markdown(f"**Issue:** {rec.message}")
                     if rec.action:
                         st.markdown(f"**Recommended Action:** {rec.action}")
 
-        if info:
+        if "info" in by_severity:
             st.markdown("#### ℹ️ Suggestions")
-            for rec in info:
+            for rec in by_severity["info"]:
                 with st.expander(f"💡 {rec.message}"):
                     st.markdown(f"**Category:** {rec.category}")
                     st.markdown(f"**Issue:** {rec.message}")
@@ -1846,6 +1971,98 @@ def stage7_quality_assessment():
     else:
         st.success("🎉 No improvement recommendations - your article is excellent!")
 
+
+@st.fragment
+def _render_quality(qa):
+    """Score card, breakdowns, structure checks and recommendations for a QualityAssessment."""
+    st.markdown("---")
+
+    col1, col2 = st.columns([2, 3])
+    with col1:
+        st.image(_rating_card_svg(qa.quality_rating, qa.overall_score))
+
+    with col2:
+        st.markdown("#### 📊 Detailed Scores")
+        st.info(f"**Content Quality:** {qa.content_quality.average_score:.1f}/100")
+        st.info(f"**SEO Quality:** {qa.seo_quality.average_score:.1f}/100")
+        st.info(f"**Structure Check:** {qa.structure_check.passed_checks}/{qa.structure_check.total_checks} ✓")
+
+    st.markdown("---")
+
+    # Content Quality Breakdown
+    st.subheader("📝 Content Quality Breakdown")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Readability", f"{qa.content_quality.readability_score:.0f}", help="How easy the article is to read")
+        st.metric("Coherence", f"{qa.content_quality.coherence_score:.0f}", help="How well sections flow together")
+    with col2:
+        st.metric("Completeness", f"{qa.content_quality.completeness_score:.0f}", help="Coverage of topic")
+        st.metric("Relevance", f"{qa.content_quality.relevance_score:.0f}", help="Alignment with main topic")
+    with col3:
+        st.metric("Uniqueness", f"{qa.content_quality.uniqueness_score:.0f}", help="Originality of content")
+
+    st.markdown("---")
+
+    # SEO Quality Breakdown
+    st.subheader("🔍 SEO Quality Breakdown")
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        st.metric("Keyword Optimization", f"{qa.seo_quality.keyword_optimization:.0f}")
+        st.metric("Meta Tag Quality", f"{qa.seo_quality.meta_tag_quality:.0f}")
+    with col2:
+        st.metric("Slug Quality", f"{qa.seo_quality.slug_quality:.0f}")
+        st.metric("Schema Markup", f"{qa.seo_quality.schema_markup_quality:.0f}")
+    with col3:
+        st.metric("Social Media", f"{qa.seo_quality.social_media_optimization:.0f}")
+
+    st.markdown("---")
+
+    _render_structure(qa)
+
+    st.markdown("---")
+
+    _render_recommendations(qa)
+
+
+@st.fragment
+def stage7_quality_assessment():
+    """Stage 7: Quality Assessment"""
+    st.title("✅ Stage 7: Quality Assessment")
+    show_progress()
+    st.markdown("---")
+
+    if st.session_state.quality_assessment is None:
+        # One status block for the whole stage, updated in place when done
+        status = st.status("🔍 Analyzing article quality...", expanded=True)
+
+        try:
+
+            # Run quality assessment
+            qa = _cached_assess(
+                st.session_state.article,
+                st.session_state.analysis,
+                st.session_state.seo
+            )
+
+            # Render the results below on this same run
+            status.update(label=f"✓ Quality assessment complete: {qa.quality_rating.upper()} ({qa.overall_score:.1f}/100)", state="complete", expanded=False)
+            st.session_state.quality_assessment = qa
+
+        except Exception as e:
+            status.update(label=f"❌ Quality assessment failed: {e}", state="error")
+            logger.error(f"Quality assessment error: {e}", exc_info=True)
+            if st.button("← Back"):
+                st.session_state.stage = 6
+                st.rerun()
+            return
+
+    # Show quality assessment
+    qa = st.session_state.quality_assessment
+
+    st.success("✅ Quality assessment complete!")
+
+    _render_quality(qa)
+
     st.markdown("---")
 
     # Actions
@@ -1853,16 +2070,16 @@ def stage7_quality_assessment():
 
     with col1:
         if st.button("← Back"):
-            st.session_state.stage = 5
-            st.session_state.quality_assessment = None
+            st.session_state.stage = 6
             st.rerun()
 
     with col2:
         if st.button("✓ Download Results →", type="primary"):
-            st.session_state.stage = 7
+            st.session_state.stage = 8
             st.rerun()
 
 
+@st.fragment
 def stage8_complete():
     """Stage 8: Complete & Download"""
     st.title("✅ Conversion Complete!")
@@ -1871,20 +2088,23 @@ def stage8_complete():
 
     st.success("🎉 Your YouTube video has been successfully converted to an article!")
 
+    article = st.session_state.article
+    seo = st.session_state.seo
+    qa = st.session_state.quality_assessment
+
     # Summary
     col1, col2, col3 = st.columns(3)
     with col1:
-        st.metric("Words", st.session_state.article.word_count)
+        st.metric("Words", article.word_count)
     with col2:
-        st.metric("Sections", len(st.session_state.article.sections))
+        st.metric("Sections", len(article.sections))
     with col3:
-        st.metric("Quality Score", f"{st.session_state.quality_assessment.overall_score:.0f}/100" if st.session_state.quality_assessment else "N/A")
+        st.metric("Quality Score", f"{qa.overall_score:.0f}/100" if qa else "N/A")
 
     st.markdown("---")
 
     # Quality summary if available
-    if st.session_state.quality_assessment:
-        qa = st.session_state.quality_assessment
+    if qa:
         st.subheader("✅ Quality Assessment Summary")
         col1, col2, col3 = st.columns(3)
         with col1:
@@ -1898,29 +2118,46 @@ def stage8_complete():
     # Download options
     st.subheader("📥 Download Your Article")
 
-    # Markdown download
-    col1, col2 = st.columns(2)
+    # Markdown download, handed over only when clicked
+    col1, col2, col3 = st.columns(3)
     with col1:
         st.download_button(
             label="📄 Download Markdown",
-            data=st.session_state.article.markdown,
-            file_name=f"{st.session_state.seo.slug}.md",
+            data=lambda: article.markdown,
+            file_name=f"{seo.slug}.md",
             mime="text/markdown"
         )
 
-    with col2:
-        # JSON download
-        import json
+    # JSON downloads, serialized only when a button is clicked. The
+    # callables run off the script thread, so they close over the models
+    # instead of reading session state.
+    def _build_package(transcript=None):
+        # mode="json" turns datetimes into strings, so orjson needs no default=
         final_output = {
-            "article": st.session_state.article.model_dump(),
-            "seo": st.session_state.seo.model_dump(),
-            "transcript": st.session_state.transcript.model_dump(),
-            "quality_assessment": st.session_state.quality_assessment.model_dump() if st.session_state.quality_assessment else None
+            "article": article.model_dump(mode="json"),
+            "seo": seo.model_dump(mode="json"),
+            "quality_assessment": qa.model_dump(mode="json") if qa else None
         }
+        if transcript is not None:
+            final_output["transcript"] = transcript.model_dump(mode="json")
+        return orjson.dumps(final_output, option=orjson.OPT_INDENT_2)
+
+    with col2:
+        st.download_button(
+            label="🧾 Download Article (JSON)",
+            data=_build_package,
+            file_name=f"{seo.slug}.json",
+            mime="application/json"
+        )
+
+    with col3:
+        # The transcript and its segments dwarf the rest, so only the full
+        # package carries them
+        transcript = get_transcript()
         st.download_button(
             label="📦 Download Full Package (JSON)",
-            data=json.dumps(final_output, indent=2, default=str),
-            file_name=f"{st.session_state.seo.slug}_complete.json",
+            data=lambda: _build_package(transcript),
+            file_name=f"{seo.slug}_complete.json",
             mime="application/json"
         )
 
@@ -1932,6 +2169,20 @@ def stage8_complete():
         st.rerun()
 
 
+# Stage renderers, indexed by st.session_state.stage like _STAGE_NAMES
+_STAGES = (
+    stage0_input,
+    stage1_transcribe,
+    stage2_filter,
+    stage3_analyze,
+    stage4_select_theme,
+    stage5_write,
+    stage6_seo,
+    stage7_quality_assessment,
+    stage8_complete,
+)
+
+
 def main():
     """Main app entry point."""
     init_session_state()
@@ -1941,19 +2192,7 @@ def main():
         st.title("⚙️ Pipeline Status")
         st.markdown("---")
 
-        stages = [
-            ("📝 Input", 0),
-            ("🎤 Transcribe", 1),
-            ("🔒 Filter", 2),
-            ("🔍 Analyze", 3),
-            ("🎨 Theme", 4),
-            ("✍️ Write", 5),
-            ("🚀 SEO", 6),
-            ("✅ QA", 7),
-            ("📦 Complete", 8)
-        ]
-
-        for name, stage_num in stages:
+        for stage_num, name in enumerate(_STAGE_NAMES):
             if st.session_state.stage > stage_num:
                 st.success(f"✓ {name}")
             elif st.session_state.stage == stage_num:
@@ -1968,26 +2207,13 @@ def main():
                 reset_workflow()
                 st.rerun()
 
-    # Main content
-    if st.session_state.stage == 0:
-        stage0_input()
-    elif st.session_state.stage == 1:
-        stage1_transcribe()
-    elif st.session_state.stage == 2:
-        stage2_filter()
-    elif st.session_state.stage == 3:
-        stage3_analyze()
-    elif st.session_state.stage == 4:
-        stage4_select_theme()
-    elif st.session_state.stage == 5:
-        stage5_write()
-    elif st.session_state.stage == 6:
-        stage6_seo()
-    elif st.session_state.stage == 7:
-        stage7_quality_assessment()
-    elif st.session_state.stage == 8:
-        stage8_complete()
+    # A transcript evicted from the artifact store is fetched again
+    # (usually straight from the transcription cache)
+    if st.session_state.stage > 1 and get_transcript() is None:
+        st.session_state.stage = 1
 
+    # Main content
+    _STAGES[st.session_state.stage]()
 
 if __name__ == "__main__":
     main()
@@ -1,4 +1,5 @@
 """Configuration management using Pydantic settings."""
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from typing import Literal
 
@@ -18,17 +19,30 @@ class PipelineConfig(BaseSettings):
     analyzer_model: str = "meta-llama/Llama-3.3-70B-Instruct"
     writer_model: str = "meta-llama/Llama-3.3-70B-Instruct"
     seo_model: str = "meta-llama/Llama-3.1-8B-Instruct"
+    writer_context_tokens: int = 128000  # Context window of writer_model
+
+    # Prompt preprocessing
+    strip_fillers: bool = True  # Remove "um", "uh", etc. from transcripts before writing
+    compact_transcripts: bool = True  # Thin out the middle of very long transcripts
+    max_transcript_tokens: int = 12000
 
     # Output configuration
     output_dir: str = "./output"
     log_level: str = "INFO"
 
+    # Response caching
+    cache_dir: str = "./cache"
+    cache_stochastic: bool = False  # Also cache generations sampled at temperature > 0.3
+    cache_ttl_hours: int = 168  # Cached articles older than this are regenerated
+    cache_max_entries: int = 500  # Oldest articles are evicted beyond this many
+
     # Retry configuration
     max_retries: int = 3
     retry_delay: int = 5
 
     # Rate limiting for HF API
     requests_per_minute: int = 30
+    max_concurrency: int = 4
 
     # FFmpeg configuration (optional, auto-detect if not set)
     ffmpeg_path: str = ""
@@ -38,6 +52,12 @@ class PipelineConfig(BaseSettings):
         case_sensitive = False
 
 
+@lru_cache(maxsize=1)
 def get_config() -> PipelineConfig:
-    """Load and return pipeline configuration."""
+    """
+    Load and return pipeline configuration.
+
+    The environment and .env file are read once per process; the returned
+    config is shared, so treat it as read-only.
+    """
     return PipelineConfig()
@@ -1,14 +1,45 @@
 """Export module for multiple format support."""
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import List, Optional, Sequence, Type
+from youtube_to_article.models.schemas import FinalOutput
 from .base import BaseExporter
 from .markdown import MarkdownExporter
 from .json import JSONExporter
 from .html import HTMLExporter
 from .csv import CSVExporter
 
+
+def export_all(
+    final_output: FinalOutput,
+    formats: Sequence[Type[BaseExporter]],
+    output_dir: Optional[Path] = None,
+) -> List[Path]:
+    """Export to several formats concurrently.
+
+    Each exporter writes its own file and only reads final_output, so the
+    exports run in parallel threads without locking.
+
+    Args:
+        final_output: Complete pipeline output.
+        formats: Exporter classes to run.
+        output_dir: Directory to save exported files.
+
+    Returns:
+        Paths to the exported files, in the order of formats.
+    """
+    if not formats:
+        return []
+    exporters = [exporter_class(output_dir) for exporter_class in formats]
+    with ThreadPoolExecutor(max_workers=len(exporters)) as pool:
+        return list(pool.map(lambda exporter: exporter.export(final_output), exporters))
+
+
 __all__ = [
     "BaseExporter",
     "MarkdownExporter",
     "JSONExporter",
     "HTMLExporter",
     "CSVExporter",
+    "export_all",
 ]
@@ -4,6 +4,24 @@ from pathlib import Path
 from typing import Optional
 from youtube_to_article.models.schemas import FinalOutput
 
+# Write buffer for exported files; large enough that a typical export
+# reaches the OS in a single write call
+_WRITE_BUFFER_SIZE = 1 << 20
+
+
+def _open_buffered(path: Path, mode: str = "w", **kwargs):
+    """Open an export file for writing with a 1 MiB buffer.
+
+    Args:
+        path: File to open.
+        mode: File mode, e.g. "w" or "wb".
+        **kwargs: Passed through to open() (encoding, newline).
+
+    Returns:
+        Open file object.
+    """
+    return open(path, mode, buffering=_WRITE_BUFFER_SIZE, **kwargs)
+
 
 class BaseExporter(ABC):
     """Abstract base class for export formats."""
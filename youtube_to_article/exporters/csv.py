@@ -1,9 +1,12 @@
 """CSV format exporter."""
 import csv
 from pathlib import Path
-from typing import Optional, List, Dict, Any
+from typing import Optional, Iterator, Tuple
 from youtube_to_article.models.schemas import FinalOutput
-from .base import BaseExporter
+from .base import BaseExporter, _open_buffered
+
+# Every row has the same three columns
+_HEADER = ("Type", "Content", "Additional")
 
 
 class CSVExporter(BaseExporter):
@@ -27,111 +30,47 @@ class CSVExporter(BaseExporter):
         filename = filename or self.get_default_filename(final_output)
         output_path = self.get_output_path(filename)
 
-        # Prepare data rows
-        rows = self._prepare_data(final_output)
-
-        # Write to CSV file
-        if rows:
-            with open(output_path, "w", newline="", encoding="utf-8") as f:
-                writer = csv.DictWriter(f, fieldnames=rows[0].keys())
-                writer.writeheader()
-                writer.writerows(rows)
+        # Stream rows straight into the file under the fixed header
+        with _open_buffered(output_path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(_HEADER)
+            writer.writerows(self._iter_rows(final_output))
 
         return output_path
 
-    def _prepare_data(self, final_output: FinalOutput) -> List[Dict[str, Any]]:
-        """Prepare data for CSV export.
+    def _iter_rows(self, final_output: FinalOutput) -> Iterator[Tuple[str, str, str]]:
+        """Generate rows for CSV export.
 
         Args:
             final_output: Pipeline output.
 
-        Returns:
-            List of dictionaries for CSV rows.
+        Yields:
+            (Type, Content, Additional) tuples, one per CSV row.
         """
-        rows = []
-
         # Add headline
-        rows.append({
-            "Type": "Headline",
-            "Content": final_output.article.headline,
-            "Additional": ""
-        })
+        yield ("Headline", final_output.article.headline, "")
 
         # Add introduction
-        rows.append({
-            "Type": "Introduction",
-            "Content": final_output.article.introduction,
-            "Additional": ""
-        })
+        yield ("Introduction", final_output.article.introduction, "")
 
         # Add sections
         for section in final_output.article.sections:
-            rows.append({
-                "Type": "Section Heading",
-                "Content": section.heading,
-                "Additional": f"Word Count: {section.word_count}"
-            })
-            rows.append({
-                "Type": "Section Content",
-                "Content": section.content,
-                "Additional": ""
-            })
+            yield ("Section Heading", section.heading, f"Word Count: {section.word_count}")
+            yield ("Section Content", section.content, "")
 
         # Add conclusion
-        rows.append({
-            "Type": "Conclusion",
-            "Content": final_output.article.conclusion,
-            "Additional": ""
-        })
+        yield ("Conclusion", final_output.article.conclusion, "")
 
         # Add metadata
-        rows.append({
-            "Type": "Metadata",
-            "Content": "Source Video",
-            "Additional": final_output.source_video.title
-        })
-        rows.append({
-            "Type": "Metadata",
-            "Content": "Channel",
-            "Additional": final_output.source_video.channel
-        })
-        rows.append({
-            "Type": "Metadata",
-            "Content": "Video ID",
-            "Additional": final_output.source_video.video_id
-        })
-        rows.append({
-            "Type": "Metadata",
-            "Content": "Video Duration",
-            "Additional": f"{final_output.source_video.duration_seconds} seconds"
-        })
+        yield ("Metadata", "Source Video", final_output.source_video.title)
+        yield ("Metadata", "Channel", final_output.source_video.channel)
+        yield ("Metadata", "Video ID", final_output.source_video.video_id)
+        yield ("Metadata", "Video Duration", f"{final_output.source_video.duration_seconds} seconds")
 
         # Add SEO information if available
         if final_output.seo:
-            rows.append({
-                "Type": "SEO",
-                "Content": "Meta Title",
-                "Additional": final_output.seo.meta_title
-            })
-            rows.append({
-                "Type": "SEO",
-                "Content": "Meta Description",
-                "Additional": final_output.seo.meta_description
-            })
-            rows.append({
-                "Type": "SEO",
-                "Content": "Slug",
-                "Additional": final_output.seo.slug
-            })
-            rows.append({
-                "Type": "SEO",
-                "Content": "Primary Keyword",
-                "Additional": final_output.seo.primary_keyword
-            })
-            rows.append({
-                "Type": "SEO",
-                "Content": "Secondary Keywords",
-                "Additional": ", ".join(final_output.seo.secondary_keywords)
-            })
-
-        return rows
+            yield ("SEO", "Meta Title", final_output.seo.meta_title)
+            yield ("SEO", "Meta Description", final_output.seo.meta_description)
+            yield ("SEO", "Slug", final_output.seo.slug)
+            yield ("SEO", "Primary Keyword", final_output.seo.primary_keyword)
+            yield ("SEO", "Secondary Keywords", ", ".join(final_output.seo.secondary_keywords))
@@ -1,162 +1,14 @@
 """HTML format exporter."""
 import html
+from itertools import chain
 from pathlib import Path
 from typing import Optional
-from markdown import markdown as md_to_html
+from markdown import Markdown
 from youtube_to_article.models.schemas import FinalOutput
-from .base import BaseExporter
+from .base import BaseExporter, _open_buffered
 
-
-class HTMLExporter(BaseExporter):
-    """Export articles in HTML format."""
-
-    @property
-    def file_extension(self) -> str:
-        """Return file extension."""
-        return "html"
-
-    def export(self, final_output: FinalOutput, filename: Optional[str] = None) -> Path:
-        """Export to HTML format.
-
-        Args:
-            final_output: Pipeline output.
-            filename: Optional custom filename.
-
-        Returns:
-            Path to exported file.
-        """
-        filename = filename or self.get_default_filename(final_output)
-        output_path = self.get_output_path(filename)
-
-        # Build HTML content
-        content = self._build_html(final_output)
-
-        # Write to file
-        output_path.write_text(content, encoding="utf-8")
-        return output_path
-
-    def _build_html(self, final_output: FinalOutput) -> str:
-        """Build HTML content from pipeline output.
-
-        Args:
-            final_output: Pipeline output.
-
-        Returns:
-            Formatted HTML string.
-        """
-        article = final_output.article
-        seo = final_output.seo
-        video = final_output.source_video
-
-        # Convert markdown sections to HTML
-        intro_html = md_to_html(article.introduction)
-        sections_html = ""
-        for section in article.sections:
-            sections_html += f"<h2>{html.escape(section.heading)}</h2>\n"
-            sections_html += md_to_html(section.content) + "\n"
-
-        conclusion_html = md_to_html(article.conclusion)
-
-        # Build HTML document
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{html.escape(article.headline)}</title>
-    {self._build_meta_tags(seo)}
-    <style>
-        {self._build_css()}
-    </style>
-</head>
-<body>
-    <article>
-        <header>
-            <h1>{html.escape(article.headline)}</h1>
-            <div class="article-meta">
-                <span class="source">Source: <a href="{html.escape(video.url)}" target="_blank">{html.escape(video.title)}</a></span>
-                <span class="channel">Channel: {html.escape(video.channel)}</span>
-                <span class="generated">Generated: {final_output.generated_at.strftime('%Y-%m-%d %H:%M:%S')}</span>
-            </div>
-        </header>
-
-        <section class="introduction">
-            {intro_html}
-        </section>
-
-        <main>
-            {sections_html}
-        </main>
-
-        <section class="conclusion">
-            <h2>Conclusion</h2>
-            {conclusion_html}
-        </section>
-
-        {self._build_metadata_section(final_output)}
-    </article>
-</body>
-</html>"""
-
-        return html_content
-
-    def _build_meta_tags(self, seo) -> str:
-        """Build meta tags from SEO package.
-
-        Args:
-            seo: SEO package.
-
-        Returns:
-            Meta tags HTML string.
-        """
-        if not seo:
-            return ""
-
-        tags = f"""<meta name="description" content="{html.escape(seo.meta_description)}">
-    <meta name="keywords" content="{html.escape(', '.join([seo.primary_keyword] + seo.secondary_keywords))}">
-    <meta property="og:title" content="{html.escape(seo.open_graph.get('title', ''))}">
-    <meta property="og:description" content="{html.escape(seo.open_graph.get('description', ''))}">
-    <meta name="twitter:title" content="{html.escape(seo.twitter_card.get('title', ''))}">
-    <meta name="twitter:description" content="{html.escape(seo.twitter_card.get('description', ''))}">"""
-
-        return tags
-
-    def _build_metadata_section(self, final_output: FinalOutput) -> str:
-        """Build metadata section if available.
-
-        Args:
-            final_output: Pipeline output.
-
-        Returns:
-            Metadata section HTML.
-        """
-        if not final_output.seo:
-            return ""
-
-        seo = final_output.seo
-        keywords = ", ".join([seo.primary_keyword] + seo.secondary_keywords)
-
-        return f"""<footer class="metadata">
-            <h3>Article Metadata</h3>
-            <dl>
-                <dt>Slug</dt>
-                <dd>{html.escape(seo.slug)}</dd>
-                <dt>Primary Keyword</dt>
-                <dd>{html.escape(seo.primary_keyword)}</dd>
-                <dt>Keywords</dt>
-                <dd>{html.escape(keywords)}</dd>
-                <dt>Reading Time</dt>
-                <dd>{final_output.article.word_count // 200} minutes</dd>
-            </dl>
-        </footer>"""
-
-    def _build_css(self) -> str:
-        """Build CSS styles.
-
-        Returns:
-            CSS string.
-        """
-        return """
+# Stylesheet inlined into every exported page
+_DEFAULT_CSS = """
         * {
             margin: 0;
             padding: 0;
@@ -320,3 +172,196 @@ class HTMLExporter(BaseExporter):
             }
         }
         """
+
+
+# Page skeleton; every field is filled in already escaped or rendered
+_PAGE_TEMPLATE = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>{headline}</title>
+    {meta_tags}
+    <style>
+        {css}
+    </style>
+</head>
+<body>
+    <article>
+        <header>
+            <h1>{headline}</h1>
+            <div class="article-meta">
+                <span class="source">Source: <a href="{video_url}" target="_blank">{video_title}</a></span>
+                <span class="channel">Channel: {channel}</span>
+                <span class="generated">Generated: {generated}</span>
+            </div>
+        </header>
+
+        <section class="introduction">
+            {intro_html}
+        </section>
+
+        <main>
+            {sections_html}
+        </main>
+
+        <section class="conclusion">
+            <h2>Conclusion</h2>
+            {conclusion_html}
+        </section>
+
+        {metadata_section}
+    </article>
+</body>
+</html>"""
+
+
+class HTMLExporter(BaseExporter):
+    """Export articles in HTML format."""
+
+    def __init__(self, output_dir: Optional[Path] = None):
+        """Initialize exporter.
+
+        Args:
+            output_dir: Directory to save exported files. If None, uses current directory.
+        """
+        super().__init__(output_dir)
+        # One parser per exporter, reset between conversions; Markdown
+        # instances are not thread-safe, so it is not shared across exporters
+        self._md = Markdown()
+
+    @property
+    def file_extension(self) -> str:
+        """Return file extension."""
+        return "html"
+
+    def export(self, final_output: FinalOutput, filename: Optional[str] = None) -> Path:
+        """Export to HTML format.
+
+        Args:
+            final_output: Pipeline output.
+            filename: Optional custom filename.
+
+        Returns:
+            Path to exported file.
+        """
+        filename = filename or self.get_default_filename(final_output)
+        output_path = self.get_output_path(filename)
+
+        # Build HTML content
+        content = self._build_html(final_output)
+
+        # Write to file
+        with _open_buffered(output_path, "w", encoding="utf-8") as f:
+            f.write(content)
+        return output_path
+
+    def _build_html(self, final_output: FinalOutput) -> str:
+        """Build HTML content from pipeline output.
+
+        Args:
+            final_output: Pipeline output.
+
+        Returns:
+            Formatted HTML string.
+        """
+        article = final_output.article
+        seo = final_output.seo
+        video = final_output.source_video
+
+        # Convert markdown sections to HTML
+        intro_html = self._md_to_html(article.introduction)
+        sections_html = "".join(
+            f"<h2>{html.escape(section.heading)}</h2>\n{self._md_to_html(section.content)}\n"
+            for section in article.sections
+        )
+
+        conclusion_html = self._md_to_html(article.conclusion)
+
+        # Escaped keyword list, shared by the meta tags and the footer
+        keywords = html.escape(", ".join(chain((seo.primary_keyword,), seo.secondary_keywords))) if seo else ""
+
+        # Build HTML document
+        return _PAGE_TEMPLATE.format(
+            headline=html.escape(article.headline),
+            meta_tags=self._build_meta_tags(seo, keywords),
+            css=self._build_css(),
+            video_url=html.escape(video.url),
+            video_title=html.escape(video.title),
+            channel=html.escape(video.channel),
+            generated=final_output.generated_at.strftime('%Y-%m-%d %H:%M:%S'),
+            intro_html=intro_html,
+            sections_html=sections_html,
+            conclusion_html=conclusion_html,
+            metadata_section=self._build_metadata_section(final_output, keywords)
+        )
+
+    def _md_to_html(self, text: str) -> str:
+        """Convert markdown text to HTML with the exporter's parser.
+
+        Args:
+            text: Markdown text.
+
+        Returns:
+            HTML fragment.
+        """
+        return self._md.reset().convert(text)
+
+    def _build_meta_tags(self, seo, keywords: str) -> str:
+        """Build meta tags from SEO package.
+
+        Args:
+            seo: SEO package.
+            keywords: HTML-escaped, comma-separated keyword list.
+
+        Returns:
+            Meta tags HTML string.
+        """
+        if not seo:
+            return ""
+
+        tags = f"""<meta name="description" content="{html.escape(seo.meta_description)}">
+    <meta name="keywords" content="{keywords}">
+    <meta property="og:title" content="{html.escape(seo.open_graph.get('title', ''))}">
+    <meta property="og:description" content="{html.escape(seo.open_graph.get('description', ''))}">
+    <meta name="twitter:title" content="{html.escape(seo.twitter_card.get('title', ''))}">
+    <meta name="twitter:description" content="{html.escape(seo.twitter_card.get('description', ''))}">"""
+
+        return tags
+
+    def _build_metadata_section(self, final_output: FinalOutput, keywords: str) -> str:
+        """Build metadata section if available.
+
+        Args:
+            final_output: Pipeline output.
+            keywords: HTML-escaped, comma-separated keyword list.
+
+        Returns:
+            Metadata section HTML.
+        """
+        if not final_output.seo:
+            return ""
+
+        seo = final_output.seo
+
+        return f"""<footer class="metadata">
+            <h3>Article Metadata</h3>
+            <dl>
+                <dt>Slug</dt>
+                <dd>{html.escape(seo.slug)}</dd>
+                <dt>Primary Keyword</dt>
+                <dd>{html.escape(seo.primary_keyword)}</dd>
+                <dt>Keywords</dt>
+                <dd>{keywords}</dd>
+                <dt>Reading Time</dt>
+                <dd>{final_output.article.word_count // 200} minutes</dd>
+            </dl>
+        </footer>"""
+
+    def _build_css(self) -> str:
+        """Return CSS styles for the exported page.
+
+        Returns:
+            CSS string.
+        """
+        return _DEFAULT_CSS
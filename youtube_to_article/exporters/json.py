@@ -1,9 +1,8 @@
 """JSON format exporter."""
-import json
 from pathlib import Path
 from typing import Optional
 from youtube_to_article.models.schemas import FinalOutput
-from .base import BaseExporter
+from .base import BaseExporter, _open_buffered
 
 
 class JSONExporter(BaseExporter):
@@ -27,11 +26,9 @@ class JSONExporter(BaseExporter):
         filename = filename or self.get_default_filename(final_output)
         output_path = self.get_output_path(filename)
 
-        # Convert to JSON-serializable dict
-        data = final_output.model_dump(mode="json")
-
-        # Write to file with pretty printing
-        with open(output_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        # Serialize straight from the model in pydantic-core, with no
+        # intermediate dict, and write the UTF-8 bytes in one go
+        with _open_buffered(output_path, "wb") as f:
+            f.write(final_output.model_dump_json(indent=2).encode("utf-8"))
 
         return output_path
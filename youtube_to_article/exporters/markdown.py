@@ -2,7 +2,7 @@
 from pathlib import Path
 from typing import Optional
 from youtube_to_article.models.schemas import FinalOutput
-from .base import BaseExporter
+from .base import BaseExporter, _open_buffered
 
 
 class MarkdownExporter(BaseExporter):
@@ -30,7 +30,8 @@ class MarkdownExporter(BaseExporter):
         content = self._build_markdown(final_output)
 
         # Write to file
-        output_path.write_text(content, encoding="utf-8")
+        with _open_buffered(output_path, "w", encoding="utf-8") as f:
+            f.write(content)
         return output_path
 
     def _build_markdown(self, final_output: FinalOutput) -> str:
@@ -42,42 +43,35 @@ class MarkdownExporter(BaseExporter):
         Returns:
             Formatted markdown string.
         """
-        lines = []
-
-        # Title
-        lines.append(f"# {final_output.article.headline}\n")
-
-        # Meta information
-        lines.append("---")
-        lines.append(f"Source: {final_output.source_video.title}")
-        lines.append(f"Channel: {final_output.source_video.channel}")
-        lines.append(f"Video ID: {final_output.source_video.video_id}")
-        if final_output.seo:
-            lines.append(f"Slug: {final_output.seo.slug}")
-            lines.append(f"Keywords: {', '.join([final_output.seo.primary_keyword] + final_output.seo.secondary_keywords)}")
-        lines.append(f"Generated: {final_output.generated_at.isoformat()}")
-        lines.append("---\n")
-
-        # Introduction
-        lines.append(final_output.article.introduction)
-        lines.append("")
+        article = final_output.article
+        video = final_output.source_video
+        seo = final_output.seo
+
+        # SEO lines only exist when an SEO package was generated
+        seo_meta = ""
+        seo_footer = ""
+        if seo:
+            seo_meta = f"Slug: {seo.slug}\nKeywords: {', '.join([seo.primary_keyword] + seo.secondary_keywords)}\n"
+            seo_footer = (
+                "\n---\n### SEO Metadata\n"
+                f"**Meta Title:** {seo.meta_title}\n"
+                f"**Meta Description:** {seo.meta_description}"
+            )
 
         # Body sections
-        for section in final_output.article.sections:
-            lines.append(f"## {section.heading}\n")
-            lines.append(section.content)
-            lines.append("")
-
-        # Conclusion
-        lines.append("## Conclusion\n")
-        lines.append(final_output.article.conclusion)
-        lines.append("")
-
-        # Footer with SEO info if available
-        if final_output.seo:
-            lines.append("---")
-            lines.append("### SEO Metadata")
-            lines.append(f"**Meta Title:** {final_output.seo.meta_title}")
-            lines.append(f"**Meta Description:** {final_output.seo.meta_description}")
-
-        return "\n".join(lines)
+        sections = "".join(f"## {section.heading}\n\n{section.content}\n\n" for section in article.sections)
+
+        return (
+            f"# {article.headline}\n\n"
+            "---\n"
+            f"Source: {video.title}\n"
+            f"Channel: {video.channel}\n"
+            f"Video ID: {video.video_id}\n"
+            f"{seo_meta}"
+            f"Generated: {final_output.generated_at.isoformat()}\n"
+            "---\n\n"
+            f"{article.introduction}\n\n"
+            f"{sections}"
+            f"## Conclusion\n\n{article.conclusion}\n"
+            f"{seo_footer}"
+        )
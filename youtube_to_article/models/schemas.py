@@ -61,6 +61,17 @@ class ContentAnalysis(BaseModel):
     estimated_reading_time: int = Field(description="Estimated reading time in minutes")
     content_flags: List[str] = Field(default_factory=list, description="List of policy or quality flags identified")
 
+    @property
+    def rendered_sections(self) -> str:
+        """Suggested sections as "- title: description" prompt lines."""
+        # Not cached: the UI edits suggested_sections in place
+        return "\n".join(f"- {s.title}: {s.description}" for s in self.suggested_sections)
+
+    @property
+    def rendered_subtopics(self) -> str:
+        """Subtopics as a comma-separated prompt string."""
+        return ", ".join(self.subtopics)
+
 
 # ============================================================================
 # Stage 2.5: Article Theme Selection
@@ -122,6 +133,25 @@ class Article(BaseModel):
     markdown: str = Field(description="Complete article in Markdown format")
     word_count: int = Field(description="Total word count")
 
+    def rebuild_markdown(self) -> None:
+        """Regenerate markdown and word_count from the structured fields.
+
+        Section word counts are reused as-is, so callers editing a section's
+        content must refresh that section's word_count first.
+        """
+        parts = [f"# {self.headline}", self.introduction]
+        parts.extend(f"## {section.heading}\n\n{section.content}" for section in self.sections)
+        if self.conclusion:
+            parts.append(f"## Conclusion\n\n{self.conclusion}")
+        self.markdown = "\n\n".join(parts) + "\n"
+        # Same per-part total the writer computes when parsing
+        self.word_count = (
+            len(self.headline.split())
+            + len(self.introduction.split())
+            + sum(section.word_count for section in self.sections)
+            + len(self.conclusion.split())
+        )
+
 
 # ============================================================================
 # Agent 4: SEO Optimizer Output
@@ -288,7 +318,7 @@ class FinalOutput(BaseModel):
     content_filter: Optional[ContentFilterResult] = Field(default=None, description="Content filtering results")
     analysis: ContentAnalysis = Field(description="Content analysis")
     article: Article = Field(description="Generated article")
-    seo: SEOPackage = Field(description="SEO package")
+    seo: Optional[SEOPackage] = Field(default=None, description="SEO package")
     quality_assessment: Optional[QualityAssessment] = Field(default=None, description="Quality assessment results")
     generated_at: datetime = Field(default_factory=datetime.now, description="Generation timestamp")
     pipeline_version: str = Field(default="1.0.0", description="Pipeline version")
@@ -1,7 +1,7 @@
 """Main pipeline orchestrator for YouTube-to-Article conversion."""
 import logging
 from datetime import datetime
-from typing import Optional
+from typing import Generator, Optional
 
 from config.settings import PipelineConfig, get_config
 from agents.transcriber import TranscriberAgent
@@ -15,6 +15,7 @@ from models.schemas import (
     ContentAnalysis,
     ArticleTheme,
     Article,
+    ArticleSection,
     SEOPackage,
     VideoMetadata,
     FinalOutput,
@@ -321,15 +322,51 @@ class YouTubeToArticlePipeline:
         self,
         transcript: TranscriptResult,
         analysis: ContentAnalysis,
-        theme: ArticleTheme
+        theme: ArticleTheme,
+        use_cache: bool = True
     ) -> Article:
         """
         Stage 4: Generate article with theme selection.
 
+        Drains stage4_write_stream() and returns the finished article.
+
+        Args:
+            transcript: Transcript from Stage 1
+            analysis: Analysis from Stage 2
+            theme: Article theme and style preferences from Stage 2.5
+            use_cache: False to regenerate rather than reuse a cached article
+
+        Returns:
+            Article
+        """
+        stream = self.stage4_write_stream(transcript, analysis, theme, use_cache=use_cache)
+        while True:
+            try:
+                next(stream)
+            except StopIteration as done:
+                return done.value
+
+    def stage4_write_stream(
+        self,
+        transcript: TranscriptResult,
+        analysis: ContentAnalysis,
+        theme: ArticleTheme,
+        use_cache: bool = True
+    ) -> Generator[ArticleSection, None, Article]:
+        """
+        Stage 4: Generate article with theme selection, streaming sections.
+
+        Body sections are yielded as the writer completes them so the UI can
+        show the article while it is generated.
+
         Args:
             transcript: Transcript from Stage 1
             analysis: Analysis from Stage 2
             theme: Article theme and style preferences from Stage 2.5
+            use_cache: False to regenerate rather than reuse a cached article
+
+        Yields:
+            ArticleSection objects in article order
 
         Returns:
             Article
@@ -342,25 +379,13 @@ class YouTubeToArticlePipeline:
         self.progress_tracker.start_stage(4, "article_generation")
 
         try:
-            self.progress_tracker.update(
-                step="personalizing_theme",
-                message=f"Personalizing theme: {theme.theme_style}, Audience: {theme.target_audience}...",
-                progress=0.1
-            )
-
             self.progress_tracker.update(
                 step="writing_with_theme",
                 message="Writing article with theme preferences...",
-                progress=0.5
+                progress=0.1
             )
 
-            result = self.writer.run(transcript, analysis, theme=theme)
-
-            self.progress_tracker.update(
-                step="finalizing_article",
-                message="Finalizing article content...",
-                progress=0.9
-            )
+            result = yield from self.writer.run_stream(transcript, analysis, theme=theme, use_cache=use_cache)
 
             self.progress_tracker.step(
                 step="complete",
@@ -642,9 +667,10 @@ class YouTubeToArticlePipeline:
             f.write(output.transcript.transcript)
 
         # Save SEO package
-        seo_path = video_dir / "seo.json"
-        with open(seo_path, 'w', encoding='utf-8') as f:
-            json.dump(output.seo.model_dump(), f, indent=2, default=str)
+        if output.seo:
+            seo_path = video_dir / "seo.json"
+            with open(seo_path, 'w', encoding='utf-8') as f:
+                json.dump(output.seo.model_dump(), f, indent=2, default=str)
 
         # Save content filter results
         if output.content_filter:
@@ -1,4 +1,5 @@
 """Publishing manager for coordinating exports and publishing."""
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from youtube_to_article.models.schemas import FinalOutput
@@ -76,20 +77,23 @@ class PublishingManager:
         output_dir = output_dir or self.output_dir
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        results = {}
-
-        for fmt in formats:
-            if fmt not in self.AVAILABLE_EXPORTERS:
-                continue
-
-            exporter_class = self.AVAILABLE_EXPORTERS[fmt]
-            exporter = exporter_class(output_dir)
+        exporters = {
+            fmt: self.AVAILABLE_EXPORTERS[fmt](output_dir)
+            for fmt in formats
+            if fmt in self.AVAILABLE_EXPORTERS
+        }
+        if not exporters:
+            return {}
 
-            try:
-                path = exporter.export(final_output)
-                results[fmt] = path
-            except Exception as e:
-                print(f"Error exporting to {fmt}: {e}")
+        # Each format writes its own file, so run them side by side
+        results = {}
+        with ThreadPoolExecutor(max_workers=len(exporters)) as pool:
+            futures = {fmt: pool.submit(exporter.export, final_output) for fmt, exporter in exporters.items()}
+            for fmt, future in futures.items():
+                try:
+                    results[fmt] = future.result()
+                except Exception as e:
+                    print(f"Error exporting to {fmt}: {e}")
 
         return results
 
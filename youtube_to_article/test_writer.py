@@ -0,0 +1,374 @@
+"""Tests for the Writer Agent."""
+
+import time
+from types import SimpleNamespace
+
+import pytest
+from agents.writer import WriterAgent
+from config.settings import PipelineConfig
+from models.schemas import ArticleTheme, ContentAnalysis, TranscriptResult
+
+
+@pytest.fixture
+def writer(tmp_path):
+    """Create a writer agent whose response cache lives in a temp directory."""
+    return WriterAgent(PipelineConfig(hf_token="test-token", cache_dir=str(tmp_path)))
+
+
+ARTICLE_MD = """# The Headline
+
+Intro paragraph one.
+
+Intro paragraph two.
+
+## First Section
+
+First body.
+
+## Second Section
+
+Second body text here.
+
+## Conclusion
+
+Wrap it up.
+"""
+
+
+class TestParseArticle:
+    """Test splitting generated markdown into article parts."""
+
+    def test_parts_in_order(self, writer):
+        """Test headline, introduction, sections and conclusion are routed in order."""
+        article = writer._parse_article(ARTICLE_MD)
+
+        assert article.headline == "The Headline"
+        assert article.introduction == "Intro paragraph one.\n\nIntro paragraph two."
+        assert [s.heading for s in article.sections] == ["First Section", "Second Section"]
+        assert [s.content for s in article.sections] == ["First body.", "Second body text here."]
+        assert article.conclusion == "Wrap it up."
+        assert article.markdown == ARTICLE_MD
+
+    def test_key_takeaways_is_conclusion(self, writer):
+        """Test a takeaways header is treated as the conclusion."""
+        article = writer._parse_article("# H\n\nIntro\n\n## Body\n\nText\n\n## Key Takeaways\n\nDone\n")
+
+        assert [s.heading for s in article.sections] == ["Body"]
+        assert article.conclusion == "Done"
+
+    def test_headers_in_fenced_code_are_content(self, writer):
+        """Test '#' lines inside fenced code blocks do not start sections."""
+        markdown = (
+            "# Real Headline\n\nIntro\n\n"
+            "## Setup\n\n```bash\n# install the package\npip install thing\n## not a section\n```\n\nAfter code.\n\n"
+            "## Conclusion\n\nEnd\n"
+        )
+        article = writer._parse_article(markdown)
+
+        assert article.headline == "Real Headline"
+        assert [s.heading for s in article.sections] == ["Setup"]
+        assert "# install the package" in article.sections[0].content
+        assert "## not a section" in article.sections[0].content
+        assert article.sections[0].content.endswith("After code.")
+        assert article.conclusion == "End"
+
+    def test_code_comment_is_not_headline(self, writer):
+        """Test a '#' comment in code before any header is not taken as the headline."""
+        article = writer._parse_article("Intro\n\n```python\n# comment\n```\n\n## Body\n\nText\n")
+
+        assert article.headline == "Untitled Article"
+        assert "# comment" in article.introduction
+
+    def test_missing_headline(self, writer):
+        """Test text before the first section becomes the introduction without a headline."""
+        article = writer._parse_article("Intro text\n\n## Body\n\nText\n\n## Conclusion\n\nEnd\n")
+
+        assert article.headline == "Untitled Article"
+        assert article.introduction == "Intro text"
+        assert [s.heading for s in article.sections] == ["Body"]
+        assert article.conclusion == "End"
+
+    def test_missing_conclusion(self, writer):
+        """Test an article without a conclusion keeps every section."""
+        article = writer._parse_article("# H\n\nIntro\n\n## One\n\nA\n\n## Two\n\nB\n")
+
+        assert [s.heading for s in article.sections] == ["One", "Two"]
+        assert article.sections[-1].content == "B"
+        assert article.conclusion == ""
+
+    def test_no_sections(self, writer):
+        """Test markdown without section headers becomes a single Content section."""
+        article = writer._parse_article("Just some words here")
+
+        assert [s.heading for s in article.sections] == ["Content"]
+        assert article.sections[0].content == "Just some words here"
+        assert article.word_count == 4
+
+    def test_word_count(self, writer):
+        """Test word count covers headline, introduction, section bodies and conclusion, not section headers."""
+        article = writer._parse_article(ARTICLE_MD)
+
+        # headline 2 + intro 6 + sections 2 + 4 + conclusion 3
+        assert [s.word_count for s in article.sections] == [2, 4]
+        assert article.word_count == 17
+
+    def test_crlf_line_endings(self, writer):
+        """Test CRLF output parses the same as LF output."""
+        crlf = writer._parse_article(ARTICLE_MD.replace("\n", "\r\n"))
+        lf = writer._parse_article(ARTICLE_MD)
+
+        assert crlf.model_dump(exclude={"markdown"}) == lf.model_dump(exclude={"markdown"})
+
+
+def _analysis(reading_time: int) -> ContentAnalysis:
+    """Minimal content analysis with the given reading time."""
+    return ContentAnalysis(
+        main_topic="Topic",
+        subtopics=[],
+        key_quotes=[],
+        data_points=[],
+        suggested_sections=[],
+        target_audience="general",
+        tone="neutral",
+        estimated_reading_time=reading_time,
+    )
+
+
+class TestMaxTokens:
+    """Test the output token budget."""
+
+    @pytest.mark.parametrize("reading_time", range(1, 61))
+    def test_budget_never_exceeds_previous(self, writer, reading_time):
+        """Test the budget is never above the old 1.3 tokens/word + 500 budget."""
+        previous = min(int(reading_time * 200 * 1.3) + 500, 4000)
+        assert writer._max_tokens(_analysis(reading_time)) <= previous
+
+    def test_budget_covers_target_words(self, writer):
+        """Test the budget still allows 1.25 tokens per target word."""
+        # 5 minutes ~ 1000 words
+        assert writer._max_tokens(_analysis(5)) == 1378
+
+    def test_budget_is_capped(self, writer):
+        """Test long articles are capped at the model output limit."""
+        assert writer._max_tokens(_analysis(60)) == 4000
+
+
+TRANSCRIPT = TranscriptResult(
+    video_id="vid123",
+    title="Test Video",
+    channel="Test Channel",
+    duration_seconds=300,
+    transcript="Today we talk about testing. Tests catch regressions early.",
+    segments=[],
+    source="captions",
+    language="en",
+)
+
+# Near-greedy sampling, so requests are cacheable
+FACTUAL = ArticleTheme(theme_style="professional")
+
+
+class StubClient:
+    """Stands in for InferenceClient, replaying canned completions and recording requests."""
+
+    def __init__(self, *replies: str, chunk_size: int = 7):
+        self.replies = list(replies)
+        self.chunk_size = chunk_size
+        self.requests = []
+        self.chat = SimpleNamespace(completions=SimpleNamespace(create=self._create))
+
+    def _create(self, stream=False, **request):
+        self.requests.append(request)
+        text = self.replies[min(len(self.requests), len(self.replies)) - 1]
+        if not stream:
+            return SimpleNamespace(choices=[SimpleNamespace(message=SimpleNamespace(content=text))])
+        return iter(
+            SimpleNamespace(choices=[SimpleNamespace(delta=SimpleNamespace(content=text[i:i + self.chunk_size]))])
+            for i in range(0, len(text), self.chunk_size)
+        )
+
+
+class TestResponseCache:
+    """Test the on-disk article response cache."""
+
+    def test_identical_request_is_cached(self, writer):
+        """Test a repeated request is served from the cache."""
+        writer.client = StubClient(ARTICLE_MD)
+
+        first = writer.run(TRANSCRIPT, _analysis(5), FACTUAL)
+        second = writer.run(TRANSCRIPT, _analysis(5), FACTUAL)
+
+        assert len(writer.client.requests) == 1
+        assert second == first
+
+    def test_use_cache_false_regenerates(self, writer):
+        """Test use_cache=False calls the model and stores the fresh article."""
+        writer.client = StubClient(ARTICLE_MD, ARTICLE_MD.replace("The Headline", "Fresh Headline"))
+
+        writer.run(TRANSCRIPT, _analysis(5), FACTUAL)
+        fresh = writer.run(TRANSCRIPT, _analysis(5), FACTUAL, use_cache=False)
+        cached = writer.run(TRANSCRIPT, _analysis(5), FACTUAL)
+
+        assert len(writer.client.requests) == 2
+        assert fresh.headline == cached.headline == "Fresh Headline"
+
+    def test_expired_entry_is_regenerated(self, writer):
+        """Test entries older than cache_ttl_hours are not served."""
+        writer._cache_put("key", "old")
+
+        assert writer._cache_get("key") == "old"
+        writer.config.cache_ttl_hours = 0
+        time.sleep(0.01)
+        assert writer._cache_get("key") is None
+
+    def test_oldest_entries_are_evicted(self, writer):
+        """Test the cache keeps at most cache_max_entries entries."""
+        writer.config.cache_max_entries = 2
+        for key in ("a", "b", "c"):
+            writer._cache_put(key, key)
+
+        assert writer._cache_get("a") is None
+        assert writer._cache_get("b") == "b"
+        assert writer._cache_get("c") == "c"
+
+    def test_clear_cache(self, writer):
+        """Test clear_cache drops every entry."""
+        writer._cache_put("key", "value")
+        writer.clear_cache()
+
+        assert writer._cache_get("key") is None
+
+
+class TestStripFillers:
+    """Test verbal filler removal from the transcript sent to the model."""
+
+    def _prompt_transcript(self, writer, text):
+        """Transcript text as it appears in the writer prompt."""
+        transcript = TRANSCRIPT.model_copy(update={"transcript": text})
+        prompt = writer._build_writer_prompt(transcript, _analysis(5), None)
+        return prompt.split("FULL TRANSCRIPT:\n", 1)[1].split("\n", 1)[0]
+
+    @pytest.mark.parametrize("text, expected", [
+        ("So, um, this is uh the plan.", "this is the plan."),
+        ("It works. Like, really well.", "It works. really well."),
+        ("Right?  You know, it is basically done.", "Right? it is done."),
+        ("I mean, literally everyone\nuses it.", "everyone uses it."),
+    ])
+    def test_fillers_are_stripped(self, writer, text, expected):
+        """Test hesitations anywhere and comma fillers opening a sentence are removed."""
+        assert self._prompt_transcript(writer, text) == expected
+
+    @pytest.mark.parametrize("text", [
+        "Pick fruits I like, such as apples.",
+        "It was late, so, we went home.",
+        "Ask anyone you know, they agree.",
+        "That is what I mean, in short.",
+        "Umbrellas are useful.",
+    ])
+    def test_meaningful_words_are_kept(self, writer, text):
+        """Test comma-conditional words inside a sentence and words containing fillers survive."""
+        assert self._prompt_transcript(writer, text) == text
+
+
+def _article(n: int) -> str:
+    """Small generated article whose headline identifies it."""
+    return ARTICLE_MD.replace("The Headline", f"Article {n}")
+
+
+BATCH = [(TRANSCRIPT, _analysis(5), None), (TRANSCRIPT, _analysis(5), None)]
+
+
+class TestRunBatch:
+    """Test packing several articles into one request."""
+
+    def test_items_share_one_batch(self, writer):
+        """Test small items are packed together within the output cap."""
+        assert writer._pack_batches(BATCH) == [[0, 1]]
+
+    def test_oversized_items_get_own_batches(self, writer):
+        """Test items whose combined budgets exceed the cap are split."""
+        items = [(TRANSCRIPT, _analysis(15), None)] * 2
+        assert writer._pack_batches(items) == [[0], [1]]
+
+    def test_well_formed_response_is_split(self, writer):
+        """Test each marked chunk is routed to its item in one call, whatever the order."""
+        writer.client = StubClient(
+            f"=== ARTICLE 1 ===\n{_article(1)}\n=== ARTICLE 0 ===\n{_article(0)}"
+        )
+
+        articles = writer.run_batch(BATCH)
+
+        assert len(writer.client.requests) == 1
+        assert [a.headline for a in articles] == ["Article 0", "Article 1"]
+        assert [s.heading for s in articles[0].sections] == ["First Section", "Second Section"]
+
+    @pytest.mark.parametrize("packed", [
+        f"=== ARTICLE 0 ===\n{_article(0)}",
+        f"=== ARTICLE 0 ===\n{_article(0)}\n=== ARTICLE 1 ===\n{_article(9)}\n=== ARTICLE 1 ===\n{_article(9)}",
+        f"=== ARTICLE 0 ===\n{_article(0)}\n=== ARTICLE 1 ===\n",
+    ], ids=["dropped", "duplicated", "empty"])
+    def test_unusable_marker_falls_back_to_run(self, writer, packed):
+        """Test an item without exactly one non-empty chunk is regenerated on its own."""
+        writer.client = StubClient(packed, _article(1))
+
+        articles = writer.run_batch(BATCH)
+
+        assert len(writer.client.requests) == 2
+        assert [a.headline for a in articles] == ["Article 0", "Article 1"]
+
+    def test_no_markers_falls_back_for_every_item(self, writer):
+        """Test a response without any markers regenerates each item."""
+        writer.client = StubClient(_article(9), _article(1))
+
+        articles = writer.run_batch(BATCH)
+
+        assert len(writer.client.requests) == 3
+        assert [a.headline for a in articles] == ["Article 1", "Article 1"]
+
+
+def _drain(stream):
+    """Collect a generator's yielded items and its return value."""
+    items = []
+    while True:
+        try:
+            items.append(next(stream))
+        except StopIteration as done:
+            return items, done.value
+
+
+FENCED_MD = ARTICLE_MD.replace("First body.", "First body.\n\n```bash\n## not a header\n```")
+
+
+class TestRunStream:
+    """Test streaming sections while the article is generated."""
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 64, 4096])
+    @pytest.mark.parametrize("markdown", [ARTICLE_MD, FENCED_MD], ids=["plain", "fenced"])
+    def test_yielded_sections_match_article(self, writer, markdown, chunk_size):
+        """Test the yielded sections are exactly the returned article's sections."""
+        writer.client = StubClient(markdown, chunk_size=chunk_size)
+
+        sections, article = _drain(writer.run_stream(TRANSCRIPT, _analysis(5)))
+
+        assert sections == article.sections
+        assert [s.heading for s in sections] == ["First Section", "Second Section"]
+
+    def test_cached_stream_yields_sections(self, writer):
+        """Test an article served from the cache still yields its sections."""
+        writer.client = StubClient(ARTICLE_MD)
+        _, first = _drain(writer.run_stream(TRANSCRIPT, _analysis(5), FACTUAL))
+
+        sections, article = _drain(writer.run_stream(TRANSCRIPT, _analysis(5), FACTUAL))
+
+        assert len(writer.client.requests) == 1
+        assert sections == article.sections == first.sections
+
+    def test_run_equals_drained_stream(self, writer):
+        """Test run() returns the same article as draining run_stream()."""
+        writer.client = StubClient(FENCED_MD)
+
+        _, streamed = _drain(writer.run_stream(TRANSCRIPT, _analysis(5)))
+        article = writer.run(TRANSCRIPT, _analysis(5))
+
+        assert len(writer.client.requests) == 2
+        assert article == streamed